@@ -10,43 +10,61 @@ def main():
     print("Building JE2BE Resource Pack Converter...")
     
     try:
-        import PyInstaller
+        import nuitka
     except ImportError:
-        print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        print("Installing Nuitka...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "nuitka"])
     
     if os.path.exists('dist'):
         shutil.rmtree('dist')
     if os.path.exists('build'):
         shutil.rmtree('build')
     
+    # Pack the mapping files into one blob so the executable reads them in a single pass
+    if subprocess.call([sys.executable, 'tools/bake_mappings.py']) != 0:
+        print("Warning: Could not bake mappings, the executable will parse the JSON files")
+    
     cmd = [
-        'pyinstaller',
+        sys.executable, '-m', 'nuitka',
         '--onefile',
-        '--name=je2be',
-        '--icon=logo.png',
-        '--add-data=mappings;mappings',
-        '--add-data=essentials;essentials', 
-        '--add-data=rtxfix;rtxfix',
-        '--add-data=required;required',
-        '--add-data=logo.png;.',
-        '--console',
-        '--clean',
+        '--standalone',
+        '--output-dir=dist',
+        '--output-filename=je2be.exe',
+        '--windows-icon-from-ico=logo.png',
+        '--include-data-dir=mappings=mappings',
+        '--include-data-dir=essentials=essentials',
+        '--include-data-dir=rtxfix=rtxfix',
+        '--include-data-dir=required=required',
+        '--include-data-files=logo.png=logo.png',
+        '--enable-plugin=anti-bloat',
+        # Numba compiles from Python bytecode, which Nuitka-compiled modules no longer have,
+        # so the executable leaves it out and uses the NumPy/OpenCV paths
+        '--nofollow-import-to=numba',
+        '--assume-yes-for-downloads',
+        '--remove-output',
         'je2be_converter.py'
     ]
     
-    print("Running PyInstaller...")
-    result = subprocess.run(cmd)
+    print("Running Nuitka...")
+    # Inherit the terminal so compiler progress streams straight through without Python buffering
+    build_proc = subprocess.Popen(cmd, stdout=None, stderr=None)
     
-    if result.returncode == 0:
+    if build_proc.wait() == 0:
         exe_path = Path('dist/je2be.exe')
         if exe_path.exists():
             size_mb = exe_path.stat().st_size / 1024 / 1024
             print(f"Build successful! Created je2be.exe ({size_mb:.1f} MB)")
             
-            test_result = subprocess.run([str(exe_path), '--help'], 
-                                       capture_output=True, text=True)
-            if test_result.returncode == 0:
+            test_proc = subprocess.Popen([str(exe_path), '--help'],
+                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            try:
+                test_proc.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                test_proc.kill()
+                test_proc.communicate()
+                print("Error: Executable test timed out")
+                return 1
+            if test_proc.returncode == 0:
                 print("Executable test passed!")
             else:
                 print("Warning: Executable test failed")
@@ -0,0 +1,32 @@
+"""
+Numba kernels for the PBR converter
+Fuse the per-channel table lookups into one multi-threaded pass over the image.
+Importing this module requires Numba; pbr_converter falls back to NumPy without it.
+"""
+
+import numpy as np
+from numba import njit, prange, set_num_threads
+
+@njit(cache=True, parallel=True)
+def specular_to_mer(smoothness, f0_metal, emission, metalness_lut, emission_lut, roughness_lut, out):
+    """Fill out (H, W, 3) with metalness, emissive and roughness from the specular map's planes"""
+    for y in prange(smoothness.shape[0]):
+        for x in range(smoothness.shape[1]):
+            out[y, x, 0] = metalness_lut[f0_metal[y, x]]    # Red = Metalness from F0/metal ID
+            out[y, x, 1] = emission_lut[emission[y, x]]     # Green = Emissive from alpha
+            out[y, x, 2] = roughness_lut[smoothness[y, x]]  # Blue = Roughness from smoothness
+
+@njit(cache=True, parallel=True)
+def normal_to_bedrock(normal_x, normal_y, z_lut, out):
+    """Fill out (H, W, 3) with X, Y and the reconstructed Z from the normal map's X and Y planes"""
+    for y in prange(normal_x.shape[0]):
+        for x in range(normal_x.shape[1]):
+            nx = normal_x[y, x]
+            ny = normal_y[y, x]
+            out[y, x, 0] = nx
+            out[y, x, 1] = ny
+            out[y, x, 2] = z_lut[(np.int64(nx) << 8) | ny]
+
+def limit_threads(count: int):
+    """Cap the threads the kernels use, e.g. inside a process pool worker"""
+    set_num_threads(count)
@@ -3,45 +3,199 @@ Bedrock structure generator for JE2BE converter
 Creates Bedrock Edition specific files and directory structure
 """
 
-import json
+import os
+import re
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from utils import fast_json
+from utils.file_ops import fast_copy
+
 logger = logging.getLogger(__name__)
 
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+REQUIRED_DIR = Path("required")
+
+_BASIC_BLOCKS_DATA = {
+    "grass": {
+        "textures": {
+            "up": "grass_top",
+            "down": "dirt",
+            "side": "grass_side"
+        },
+        "sound": "grass"
+    },
+    "dirt": {
+        "textures": "dirt",
+        "sound": "gravel"
+    },
+    "stone": {
+        "textures": "stone",
+        "sound": "stone"
+    },
+    "cobblestone": {
+        "textures": "cobblestone",
+        "sound": "stone"
+    },
+    
+    "log_oak": {
+        "textures": {
+            "up": "log_oak_top",
+            "down": "log_oak_top",
+            "side": "log_oak"
+        },
+        "sound": "wood"
+    },
+    "planks_oak": {
+        "textures": "planks_oak",
+        "sound": "wood"
+    },
+    "leaves_oak": {
+        "textures": "leaves_oak",
+        "sound": "grass"
+    },
+    
+    "coal_ore": {
+        "textures": "coal_ore",
+        "sound": "stone"
+    },
+    "iron_ore": {
+        "textures": "iron_ore",
+        "sound": "stone"
+    },
+    "gold_ore": {
+        "textures": "gold_ore",
+        "sound": "stone"
+    },
+    "diamond_ore": {
+        "textures": "diamond_ore",
+        "sound": "stone"
+    },
+    
+    "glass": {
+        "textures": "glass",
+        "sound": "glass"
+    },
+    
+    "sand": {
+        "textures": "sand",
+        "sound": "sand"
+    },
+    "sandstone": {
+        "textures": {
+            "up": "sandstone_top",
+            "down": "sandstone_bottom",
+            "side": "sandstone_normal"
+        },
+        "sound": "stone"
+    }
+}
+
+_SOUND_MAPPINGS = {
+    "wood": ["wood", "plank", "log", "door", "trapdoor", "fence"],
+    "grass": ["grass", "leaves", "flower", "plant", "vine"],
+    "stone": ["stone", "ore", "brick", "cobble", "concrete"],
+    "sand": ["sand"],
+    "gravel": ["gravel", "dirt"],
+    "glass": ["glass"],
+    "metal": ["iron", "gold", "copper", "metal", "anvil"],
+    "cloth": ["wool", "carpet"],
+    "snow": ["snow", "ice"]
+}
+
+# Flattened in category order so the first matching keyword keeps the same sound priority
+_SOUND_KEYWORDS = tuple((keyword, sound) for sound, keywords in _SOUND_MAPPINGS.items() for keyword in keywords)
+
+_LANG_KEY_MAPPINGS = {
+    "block.minecraft.": "tile.",
+    "item.minecraft.": "item.",
+    "entity.minecraft.": "entity.",
+    "enchantment.minecraft.": "enchantment.",
+    "effect.minecraft.": "effect.",
+    "biome.minecraft.": "biome."
+}
+
+# Compact manifest.json with only the per-pack values left open, filled in with str.format
+_MANIFEST_TEMPLATE = (
+    '{{"format_version":2,"header":{{"description":{description},"name":{name},"uuid":"{header_uuid}",'
+    '"version":{version},"min_engine_version":[1,21,0]}},"modules":[{{"description":{description},'
+    '"type":"resources","uuid":"{module_uuid}","version":{version}}}]{capabilities}}}'
+)
+_PBR_CAPABILITIES = ',"capabilities":["pbr","raytraced"]'
+
+# Anchored alternation of the Java prefixes: one regex scan instead of a startswith per prefix
+_LANG_KEY_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix in _LANG_KEY_MAPPINGS))
+
+@lru_cache(maxsize=None)
+def _load_required(name: str) -> bytes:
+    """Read a static file from the required folder once and serve later conversions from memory"""
+    return (REQUIRED_DIR / name).read_bytes()
+
+def _fast_uuid4() -> str:
+    """Generate a random (version 4) UUID string straight from os.urandom"""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(raw)))
+
+@lru_cache(maxsize=4096)
+def _convert_lang_key(java_key: str) -> str:
+    """Convert Java language key to Bedrock equivalent, memoized since keys repeat across locales"""
+    match = _LANG_KEY_PREFIX_RE.match(java_key)
+    if match:
+        return _LANG_KEY_MAPPINGS[match.group()] + java_key[match.end():]
+    
+    return java_key
+
 class BedrockStructureGenerator:
     """Generates Bedrock Edition specific files and directory structure"""
     
+    REQUIRED_DIRECTORIES = (
+        "textures/blocks",
+        "textures/items",
+        "textures/entity",
+        "textures/environment",
+        "textures/particle",
+        "textures/ui",
+        "textures/colormap",
+        "textures/painting",
+        "models",
+        "sounds",
+        "texts",
+        "animations",
+        "entity",
+        "fogs",
+        "render_controllers",
+        "materials"
+    )
+    # Parents sort before their children, so shared prefixes such as textures/ are created once
+    _CREATION_ORDER = tuple(sorted(REQUIRED_DIRECTORIES))
+    
     def __init__(self):
-        self.required_directories = [
-            "textures/blocks",
-            "textures/items", 
-            "textures/entity",
-            "textures/environment",
-            "textures/particle",
-            "textures/ui",
-            "textures/colormap",
-            "textures/painting",
-            "models",
-            "sounds",
-            "texts",
-            "animations",
-            "entity",
-            "fogs",
-            "render_controllers",
-            "materials"
-        ]
+        self._run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Bedrock does not need pretty-printed JSON; compact output keeps the pack smaller
+        self.compact_json = True
+        # One listdir answers every "is this required file present" check for the run
+        self._required_contents = frozenset(os.listdir(REQUIRED_DIR)) if REQUIRED_DIR.is_dir() else frozenset()
     
     def create_bedrock_structure(self, bedrock_temp: Path):
         """Create the basic Bedrock Edition directory structure"""
         logger.info("Creating Bedrock Edition directory structure...")
         
-        for dir_path in self.required_directories:
-            full_path = bedrock_temp / dir_path
-            full_path.mkdir(parents=True, exist_ok=True)
+        # Formatted once per conversion and reused by the manifest and every lang file header
+        self._run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        makedirs = os.makedirs
+        join = os.path.join
+        root = str(bedrock_temp)
+        for dir_path in self._CREATION_ORDER:
+            makedirs(join(root, dir_path), exist_ok=True)
             logger.debug(f"Created directory: {dir_path}")
     
     def generate_manifest(self, bedrock_temp: Path, pack_name: str = None, 
@@ -52,37 +206,46 @@ class BedrockStructureGenerator:
             if not pack_name:
                 pack_name = "Converted Java Resource Pack"
             if not pack_description:
-                pack_description = f"Converted from Java Edition on {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                pack_description = f"Converted from Java Edition on {self._run_timestamp[:16]}"
             if not version:
                 version = [1, 0, 0]
                 
-            manifest = {
-                "format_version": 2,
-                "header": {
-                    "description": pack_description,
-                    "name": pack_name,
-                    "uuid": str(uuid.uuid4()),
-                    "version": version,
-                    "min_engine_version": [1, 21, 0]
-                },
-                "modules": [
-                    {
+            manifest_path = bedrock_temp / "manifest.json"
+            if self.compact_json:
+                manifest_path.write_bytes(_MANIFEST_TEMPLATE.format(
+                    description=fast_json.dumps(pack_description, indent=False).decode('utf-8'),
+                    name=fast_json.dumps(pack_name, indent=False).decode('utf-8'),
+                    header_uuid=_fast_uuid4(),
+                    module_uuid=_fast_uuid4(),
+                    version=fast_json.dumps(version, indent=False).decode('utf-8'),
+                    capabilities=_PBR_CAPABILITIES if enable_pbr else ""
+                ).encode('utf-8'))
+            else:
+                manifest = {
+                    "format_version": 2,
+                    "header": {
                         "description": pack_description,
-                        "type": "resources",
-                        "uuid": str(uuid.uuid4()),
-                        "version": version
-                    }
-                ]
-            }
+                        "name": pack_name,
+                        "uuid": _fast_uuid4(),
+                        "version": version,
+                        "min_engine_version": [1, 21, 0]
+                    },
+                    "modules": [
+                        {
+                            "description": pack_description,
+                            "type": "resources",
+                            "uuid": _fast_uuid4(),
+                            "version": version
+                        }
+                    ]
+                }
+                if enable_pbr:
+                    manifest["capabilities"] = ["pbr", "raytraced"]
+                manifest_path.write_bytes(fast_json.dumps(manifest))
             
             if enable_pbr:
-                manifest["capabilities"] = ["pbr", "raytraced"]
                 logger.info("Enabled PBR and raytraced capabilities in manifest")
             
-            manifest_path = bedrock_temp / "manifest.json"
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2)
-            
             logger.info(f"Generated manifest.json: {pack_name} v{'.'.join(map(str, version))}")
             return True
             
@@ -93,16 +256,12 @@ class BedrockStructureGenerator:
     def generate_terrain_texture_json(self, bedrock_temp: Path, pack_name: str = "converted_pack") -> bool:
         """Copy terrain_texture.json from required folder"""
         try:
-            required_file = Path("required") / "terrain_texture.json"
-            if not required_file.exists():
+            if "terrain_texture.json" not in self._required_contents:
                 logger.error("Required terrain_texture.json not found in required folder")
                 return False
             
             dest_path = bedrock_temp / "textures" / "terrain_texture.json"
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            import shutil
-            shutil.copy2(required_file, dest_path)
+            dest_path.write_bytes(_load_required("terrain_texture.json"))
             
             logger.info("Copied terrain_texture.json from required folder")
             return True
@@ -114,16 +273,12 @@ class BedrockStructureGenerator:
     def generate_item_texture_json(self, bedrock_temp: Path, pack_name: str = "converted_pack") -> bool:
         """Copy item_texture.json from required folder"""
         try:
-            required_file = Path("required") / "item_texture.json"
-            if not required_file.exists():
+            if "item_texture.json" not in self._required_contents:
                 logger.error("Required item_texture.json not found in required folder")
                 return False
             
             dest_path = bedrock_temp / "textures" / "item_texture.json"
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            import shutil
-            shutil.copy2(required_file, dest_path)
+            dest_path.write_bytes(_load_required("item_texture.json"))
             
             logger.info("Copied item_texture.json from required folder")
             return True
@@ -135,16 +290,12 @@ class BedrockStructureGenerator:
     def generate_blocks_json(self, bedrock_temp: Path) -> bool:
         """Copy blocks.json from required folder"""
         try:
-            required_file = Path("required") / "blocks.json"
-            if not required_file.exists():
+            if "blocks.json" not in self._required_contents:
                 logger.error("Required blocks.json not found in required folder")
                 return False
             
             dest_path = bedrock_temp / "blocks.json"
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            import shutil
-            shutil.copy2(required_file, dest_path)
+            dest_path.write_bytes(_load_required("blocks.json"))
             
             logger.info("Copied blocks.json from required folder")
             return True
@@ -155,99 +306,14 @@ class BedrockStructureGenerator:
     
     def _get_basic_blocks_data(self) -> Dict[str, Any]:
         """Get basic block definitions that are commonly needed"""
-        return {
-            "grass": {
-                "textures": {
-                    "up": "grass_top",
-                    "down": "dirt",
-                    "side": "grass_side"
-                },
-                "sound": "grass"
-            },
-            "dirt": {
-                "textures": "dirt",
-                "sound": "gravel"
-            },
-            "stone": {
-                "textures": "stone",
-                "sound": "stone"
-            },
-            "cobblestone": {
-                "textures": "cobblestone",
-                "sound": "stone"
-            },
-            
-            "log_oak": {
-                "textures": {
-                    "up": "log_oak_top",
-                    "down": "log_oak_top",
-                    "side": "log_oak"
-                },
-                "sound": "wood"
-            },
-            "planks_oak": {
-                "textures": "planks_oak",
-                "sound": "wood"
-            },
-            "leaves_oak": {
-                "textures": "leaves_oak",
-                "sound": "grass"
-            },
-            
-            "coal_ore": {
-                "textures": "coal_ore",
-                "sound": "stone"
-            },
-            "iron_ore": {
-                "textures": "iron_ore",
-                "sound": "stone"
-            },
-            "gold_ore": {
-                "textures": "gold_ore",
-                "sound": "stone"
-            },
-            "diamond_ore": {
-                "textures": "diamond_ore",
-                "sound": "stone"
-            },
-            
-            "glass": {
-                "textures": "glass",
-                "sound": "glass"
-            },
-            
-            "sand": {
-                "textures": "sand",
-                "sound": "sand"
-            },
-            "sandstone": {
-                "textures": {
-                    "up": "sandstone_top",
-                    "down": "sandstone_bottom",
-                    "side": "sandstone_normal"
-                },
-                "sound": "stone"
-            }
-        }
+        return _BASIC_BLOCKS_DATA
     
     def _get_block_sound(self, texture_name: str) -> str:
         """Determine appropriate sound for a block based on its texture name"""
-        sound_mappings = {
-            "wood": ["wood", "plank", "log", "door", "trapdoor", "fence"],
-            "grass": ["grass", "leaves", "flower", "plant", "vine"],
-            "stone": ["stone", "ore", "brick", "cobble", "concrete"],
-            "sand": ["sand"],
-            "gravel": ["gravel", "dirt"],
-            "glass": ["glass"],
-            "metal": ["iron", "gold", "copper", "metal", "anvil"],
-            "cloth": ["wool", "carpet"],
-            "snow": ["snow", "ice"]
-        }
-        
         texture_lower = texture_name.lower()
         
-        for sound, keywords in sound_mappings.items():
-            if any(keyword in texture_lower for keyword in keywords):
+        for keyword, sound in _SOUND_KEYWORDS:
+            if keyword in texture_lower:
                 return sound
         
         return "stone"  # Default sound
@@ -258,8 +324,7 @@ class BedrockStructureGenerator:
             pack_icon_path = bedrock_temp / "pack_icon.png"
             
             if icon_path and icon_path.exists():
-                import shutil
-                shutil.copy2(icon_path, pack_icon_path)
+                fast_copy(icon_path, pack_icon_path)
                 logger.info(f"Copied custom pack icon from {icon_path}")
             else:
                 logger.info("No custom icon provided, pack will use default Bedrock icon")
@@ -294,8 +359,7 @@ class BedrockStructureGenerator:
             }
             
             languages_path = texts_dir / "languages.json"
-            with open(languages_path, 'w', encoding='utf-8') as f:
-                json.dump(languages_data, f, indent=2)
+            languages_path.write_bytes(fast_json.dumps(languages_data, indent=not self.compact_json))
             
             logger.info("Generated language files")
             return True
@@ -307,21 +371,23 @@ class BedrockStructureGenerator:
     def _convert_lang_file(self, java_lang_file: Path, texts_dir: Path):
         """Convert Java .json lang file to Bedrock .lang format"""
         try:
-            with open(java_lang_file, 'r', encoding='utf-8') as f:
-                java_lang = json.load(f)
+            java_lang = fast_json.loads(java_lang_file.read_bytes())
             
             locale = java_lang_file.stem
             bedrock_locale = self._convert_locale_code(locale)
             
             bedrock_lang_file = texts_dir / f"{bedrock_locale}.lang"
             
-            with open(bedrock_lang_file, 'w', encoding='utf-8') as f:
-                f.write(f"## Converted from Java Edition {locale}.json\n")
-                f.write(f"## Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                for key, value in java_lang.items():
-                    bedrock_key = self._convert_lang_key(key)
-                    f.write(f"{bedrock_key}={value}\n")
+            lines = [
+                f"## Converted from Java Edition {locale}.json\n",
+                f"## Generated on {self._run_timestamp}\n\n"
+            ]
+            append = lines.append
+            convert_key = self._convert_lang_key
+            for key, value in java_lang.items():
+                append(f"{convert_key(key)}={value}\n")
+            
+            bedrock_lang_file.write_text("".join(lines), encoding='utf-8')
             
             logger.debug(f"Converted language file: {java_lang_file.name} -> {bedrock_lang_file.name}")
             
@@ -352,20 +418,7 @@ class BedrockStructureGenerator:
     
     def _convert_lang_key(self, java_key: str) -> str:
         """Convert Java language key to Bedrock equivalent"""
-        key_mappings = {
-            "block.minecraft.": "tile.",
-            "item.minecraft.": "item.",
-            "entity.minecraft.": "entity.",
-            "enchantment.minecraft.": "enchantment.",
-            "effect.minecraft.": "effect.",
-            "biome.minecraft.": "biome."
-        }
-        
-        for java_prefix, bedrock_prefix in key_mappings.items():
-            if java_key.startswith(java_prefix):
-                return java_key.replace(java_prefix, bedrock_prefix, 1)
-        
-        return java_key
+        return _convert_lang_key(java_key)
     
     def validate_bedrock_structure(self, bedrock_temp: Path) -> Dict[str, List[str]]:
         """Validate the generated Bedrock structure"""
@@ -381,22 +434,47 @@ class BedrockStructureGenerator:
             "textures/item_texture.json"
         ]
         
+        # One scandir per parent directory answers every existence check below it
+        listings: Dict[str, set] = {}
+        
+        def exists(relative_path: str) -> bool:
+            parent, _, name = relative_path.rpartition("/")
+            if parent not in listings:
+                try:
+                    with os.scandir(bedrock_temp / parent) as entries:
+                        listings[parent] = {entry.name for entry in entries}
+                except OSError:
+                    listings[parent] = set()
+            return name in listings[parent]
+        
         for required_file in required_files:
-            file_path = bedrock_temp / required_file
-            if not file_path.exists():
+            if not exists(required_file):
                 issues["missing_required_files"].append(required_file)
         
-        for required_dir in self.required_directories:
-            dir_path = bedrock_temp / required_dir
-            if not dir_path.exists():
+        for required_dir in self.REQUIRED_DIRECTORIES:
+            if not exists(required_dir):
                 issues["missing_directories"].append(required_dir)
         
-        for json_file in bedrock_temp.rglob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    json.load(f)
-            except json.JSONDecodeError:
-                relative_path = json_file.relative_to(bedrock_temp)
-                issues["invalid_json_files"].append(str(relative_path))
+        # Plain string paths from os.walk avoid building a Path object per file
+        json_files = [
+            os.path.join(root, name)
+            for root, _, files in os.walk(bedrock_temp)
+            for name in files
+            if name.endswith('.json')
+        ]
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            for json_file, valid in zip(json_files, executor.map(self._is_valid_json, json_files)):
+                if not valid:
+                    issues["invalid_json_files"].append(os.path.relpath(json_file, bedrock_temp))
         
         return issues
+    
+    @staticmethod
+    def _is_valid_json(json_file: str) -> bool:
+        """Check whether a file parses as JSON"""
+        try:
+            with open(json_file, 'rb') as f:
+                fast_json.loads(f.read())
+            return True
+        except fast_json.JSONDecodeError:
+            return False
@@ -22,20 +22,123 @@ Bedrock PBR Standard:
   - RGB: Normal XYZ (no AO or height)
 """
 
+import os
 import logging
-import json
+import multiprocessing
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from PIL import Image, ImageOps
 import numpy as np
+from utils import fast_json
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from converters import _pbr_kernels
+except ImportError:
+    _pbr_kernels = None
 
 logger = logging.getLogger(__name__)
 
+# ProcessPoolExecutor refuses more than 61 workers on Windows
+PBR_WORKERS = min(os.cpu_count() or 1, 61)
+# Below this many jobs, worker start-up (interpreter, NumPy, PIL imports) costs more than it saves
+PARALLEL_MIN_JOBS = 16
+# Smallest texture (in pixels) worth the Numba kernels' thread start-up; below it NumPy is as fast
+NUMBA_MIN_PIXELS = 256 * 256
+# Threads writing output files while the next texture is decoded; libpng and zlib release the GIL
+WRITER_THREADS = 4
+
+# Texture file types that can be part of a PBR set, in the order their matches are collected
+_TEXTURE_EXTENSIONS = {'.png': 0, '.jpg': 1, '.jpeg': 2, '.tga': 3}
+# Stems with these suffixes are PBR or Bedrock maps, never a diffuse texture
+_NON_DIFFUSE_SUFFIXES = ('_s', '_n', '_e', '_r', '_m', '_mer', '_normal')
+
+# Converter owned by each worker process, created on its first job
+_worker_converter = None
+
+# zlib level 3 encodes about twice as fast as the default 6 for a few percent larger files
+_PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 3] if cv2 is not None else []
+
+def _read_bands(path: Path) -> List[np.ndarray]:
+    """Decode an image into separate R, G, B and A planes, the same pixels PIL's convert('RGBA') gives"""
+    if cv2 is not None:
+        image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        # Grayscale PNGs can carry a tRNS colour key OpenCV ignores, and 16-bit images would
+        # need rescaling, so only 8-bit colour results are taken from OpenCV
+        if image is not None and image.dtype == np.uint8 and image.ndim == 3:
+            # Splitting BGR(A) straight into planes skips the interleaved RGBA copy
+            planes = cv2.split(image)
+            if len(planes) == 4:
+                alpha = planes[3]
+            else:
+                alpha = np.full(image.shape[:2], 255, dtype=np.uint8)
+            return [planes[2], planes[1], planes[0], alpha]
+    
+    with Image.open(path) as img:
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        return [np.asarray(band) for band in img.split()]
+
+def _write_rgb(path: Path, rgb_array: np.ndarray):
+    """Encode an RGB uint8 array as PNG"""
+    if cv2 is not None:
+        # imwrite reports False for paths it cannot open, e.g. non-ASCII paths on Windows
+        if cv2.imwrite(str(path), cv2.cvtColor(rgb_array, cv2.COLOR_RGB2BGR), _PNG_WRITE_PARAMS):
+            return
+    
+    Image.fromarray(rgb_array, 'RGB').save(path)
+
+def _grayscale_band(img: Image.Image) -> np.ndarray:
+    """Get a single-channel map's values as a 2-D uint8 array"""
+    # Metallic/emissive/roughness maps saved as colour images repeat the value in every
+    # channel, so the first band is used as-is instead of computing a weighted luminance
+    if img.mode == 'L':
+        return np.asarray(img)
+    if img.mode in ('RGB', 'RGBA', 'LA'):
+        return np.asarray(img.getchannel(0))
+    return np.asarray(ImageOps.grayscale(img))
+
+def _init_pbr_worker(blocks_dir: Path):
+    """Set up a worker process once, before its first job: converter, lookup tables and writer threads"""
+    global _worker_converter
+    _worker_converter = PBRConverter()
+    # The parent process created the output directory before starting the pool
+    _worker_converter._created_dirs.add(blocks_dir)
+    _worker_converter.start_writer()
+    
+    # Every core already runs a worker process, so the kernels get one thread each
+    if _pbr_kernels is not None:
+        _pbr_kernels.limit_threads(1)
+
+def _convert_pbr_job(job: Tuple[str, List[Tuple[str, Dict[str, Path]]], Path]) -> Dict[str, int]:
+    """Run one PBR job in a worker process and return the statistics it produced"""
+    _worker_converter.reset_stats()
+    try:
+        _worker_converter._convert_sets(*job)
+    finally:
+        # Wait for this job's writes so their failures land in its statistics
+        _worker_converter.flush(stop_writer=False)
+    return dict(_worker_converter.conversion_stats)
+
 class PBRConverter:
     """Converts Java LabPBR textures to Bedrock MER format"""
     
-    def __init__(self):
-        """Initialize the PBR converter"""
+    def __init__(self, io_executor: Optional[ThreadPoolExecutor] = None,
+                 texture_mappings: Optional[Mapping[str, str]] = None):
+        """
+        Initialize the PBR converter
+        
+        Args:
+            io_executor: Optional thread pool to write output files on instead of starting one
+            texture_mappings: Optional Java->Bedrock mappings used when convert_pbr_textures gets none
+        """
+        self.texture_mappings = texture_mappings
         self.conversion_stats = {
             "specular_converted": 0,
             "normal_converted": 0,
@@ -54,6 +157,25 @@ class PBRConverter:
             236: {"name": "platinum", "f0": [0.67, 0.69, 0.66]},
             237: {"name": "silver", "f0": [0.95, 0.93, 0.88]}
         }
+        
+        # Every specular channel maps 8 bits to 8 bits, so each conversion is a 256-entry lookup table
+        levels = np.arange(256)
+        self._roughness_lut = ((1.0 - levels / 255.0) ** 2 * 255).astype(np.uint8)
+        self._metalness_lut = np.where(levels >= 230, 255, np.where(levels > 10, levels, 0)).astype(np.uint8)
+        self._emission_lut = np.where(levels < 255, levels, 0).astype(np.uint8)
+        
+        # Background file writer, only running during a batch conversion
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._shared_executor = io_executor
+        self._pending_writes: Dict[Path, Future] = {}
+        # Output directories already created by this converter
+        self._created_dirs: Set[Path] = set()
+        
+        # Normal Z depends only on the 8-bit X and Y, so it is precomputed for all 65536 pairs,
+        # indexed by (x << 8) | y
+        normalized_squared = ((levels / 255.0) * 2.0 - 1.0) ** 2
+        nz_squared = np.maximum(0.0, 1.0 - (normalized_squared[:, None] + normalized_squared[None, :]))
+        self._normal_z_lut = ((np.sqrt(nz_squared) + 1.0) / 2.0 * 255).astype(np.uint8).ravel()
     
     def detect_pbr_textures(self, texture_dir: Path) -> Dict[str, Dict[str, Path]]:
         """
@@ -67,9 +189,11 @@ class PBRConverter:
         """
         pbr_sets = {}
         
-        texture_files = []
-        for ext in ['*.png', '*.jpg', '*.jpeg', '*.tga']:
-            texture_files.extend(texture_dir.glob(f"**/{ext}"))
+        # One walk of the tree; the stable sort keeps the old per-extension order, so a
+        # later extension still wins when two files share a stem
+        texture_files = [path for path in texture_dir.rglob('*')
+                         if path.suffix.lower() in _TEXTURE_EXTENSIONS]
+        texture_files.sort(key=lambda path: _TEXTURE_EXTENSIONS[path.suffix.lower()])
         
         for texture_file in texture_files:
             name = texture_file.stem
@@ -86,7 +210,7 @@ class PBRConverter:
                     pbr_sets[base_name] = {}
                 pbr_sets[base_name]['normal'] = texture_file
             
-            elif not any(name.endswith(suffix) for suffix in ['_s', '_n', '_e', '_r', '_m', '_mer', '_normal']):
+            elif not name.endswith(_NON_DIFFUSE_SUFFIXES):
                 if name not in pbr_sets:
                     pbr_sets[name] = {}
                 pbr_sets[name]['diffuse'] = texture_file
@@ -112,55 +236,58 @@ class PBRConverter:
             bool: True if conversion successful
         """
         try:
-            with Image.open(specular_path) as specular_img:
-                if specular_img.mode != 'RGBA':
-                    specular_img = specular_img.convert('RGBA')
-                
-                spec_array = np.array(specular_img)
-                
-                smoothness = spec_array[:, :, 0]  # Red channel
-                f0_metal = spec_array[:, :, 1]    # Green channel
-                porosity_sss = spec_array[:, :, 2]  # Blue channel
-                emission = spec_array[:, :, 3]    # Alpha channel
-                
-                mer_array = np.zeros((spec_array.shape[0], spec_array.shape[1], 3), dtype=np.uint8)
-                
-                smoothness_normalized = smoothness / 255.0
-                roughness_linear = (1.0 - smoothness_normalized) ** 2
-                roughness_bedrock = (roughness_linear * 255).astype(np.uint8)
-                mer_array[:, :, 2] = roughness_bedrock  # Blue = Roughness
-                
-                metalness = np.zeros_like(f0_metal, dtype=np.uint8)
-                
-                metal_mask = f0_metal >= 230
-                metalness[metal_mask] = 255  # Full metalness for predefined metals
-                
-                f0_mask = f0_metal < 230
-                metallic_threshold = 10
-                metalness[f0_mask & (f0_metal > metallic_threshold)] = f0_metal[f0_mask & (f0_metal > metallic_threshold)]
-                
-                mer_array[:, :, 0] = metalness  # Red = Metalness
-                
-                emission_mask = emission < 255
-                emission_bedrock = np.zeros_like(emission, dtype=np.uint8)
-                emission_bedrock[emission_mask] = emission[emission_mask]
-                mer_array[:, :, 1] = emission_bedrock  # Green = Emissive
-                
-                mer_img = Image.fromarray(mer_array, 'RGB')
-                mer_path.parent.mkdir(parents=True, exist_ok=True)
-                mer_img.save(mer_path)
-                
-                self.conversion_stats["specular_converted"] += 1
-                self.conversion_stats["mer_generated"] += 1
-                
-                logger.debug(f"Converted specular to MER: {specular_path.name} -> {mer_path.name}")
-                return True
-                
+            # Porosity/SSS (blue) has no Bedrock equivalent
+            smoothness, f0_metal, _, emission = _read_bands(specular_path)
+            
+            if cv2 is not None:
+                mer_array = self._specular_to_mer_cv2(smoothness, f0_metal, emission)
+            elif _pbr_kernels is not None and smoothness.size >= NUMBA_MIN_PIXELS:
+                mer_array = self._specular_to_mer_numba(smoothness, f0_metal, emission)
+            else:
+                mer_array = self._specular_to_mer_numpy(smoothness, f0_metal, emission)
+            
+            self._ensure_dir(mer_path.parent)
+            self._write_png(mer_path, mer_array)
+            
+            self.conversion_stats["specular_converted"] += 1
+            self.conversion_stats["mer_generated"] += 1
+            
+            logger.debug(f"Converted specular to MER: {specular_path.name} -> {mer_path.name}")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to convert specular map {specular_path}: {str(e)}")
             self.conversion_stats["errors"] += 1
             return False
     
+    def _specular_to_mer_cv2(self, smoothness: np.ndarray, f0_metal: np.ndarray,
+                             emission: np.ndarray) -> np.ndarray:
+        """Build the MER array with OpenCV's SIMD table lookups, one pass per channel"""
+        return cv2.merge([
+            cv2.LUT(f0_metal, self._metalness_lut),  # Red = Metalness
+            cv2.LUT(emission, self._emission_lut),   # Green = Emissive
+            cv2.LUT(smoothness, self._roughness_lut)  # Blue = Roughness
+        ])
+    
+    def _specular_to_mer_numba(self, smoothness: np.ndarray, f0_metal: np.ndarray,
+                               emission: np.ndarray) -> np.ndarray:
+        """Build the MER array with the fused, multi-threaded Numba kernel"""
+        mer_array = np.empty(smoothness.shape + (3,), dtype=np.uint8)
+        _pbr_kernels.specular_to_mer(smoothness, f0_metal, emission, self._metalness_lut,
+                                     self._emission_lut, self._roughness_lut, mer_array)
+        return mer_array
+    
+    def _specular_to_mer_numpy(self, smoothness: np.ndarray, f0_metal: np.ndarray,
+                               emission: np.ndarray) -> np.ndarray:
+        """Build the MER array with NumPy fancy-indexed table lookups"""
+        # np.take writes straight into each output channel; mode='clip' skips the bounds
+        # check (uint8 indices are always in range) that would otherwise buffer out
+        mer_array = np.empty(smoothness.shape + (3,), dtype=np.uint8)
+        np.take(self._metalness_lut, f0_metal, out=mer_array[:, :, 0], mode='clip')     # Red = Metalness from F0/metal ID
+        np.take(self._emission_lut, emission, out=mer_array[:, :, 1], mode='clip')      # Green = Emissive from alpha
+        np.take(self._roughness_lut, smoothness, out=mer_array[:, :, 2], mode='clip')   # Blue = Roughness from smoothness
+        return mer_array
+    
     def convert_normal_map(self, normal_path: Path, output_path: Path) -> bool:
         """
         Convert Java normal map to Bedrock format
@@ -173,42 +300,90 @@ class PBRConverter:
             bool: True if conversion successful
         """
         try:
-            with Image.open(normal_path) as normal_img:
-                if normal_img.mode != 'RGBA':
-                    normal_img = normal_img.convert('RGBA')
-                
-                normal_array = np.array(normal_img)
-                
-                normal_x = normal_array[:, :, 0]  # Red
-                normal_y = normal_array[:, :, 1]  # Green
-                nx_normalized = (normal_x / 255.0) * 2.0 - 1.0
-                ny_normalized = (normal_y / 255.0) * 2.0 - 1.0
-                
-                nz_squared = 1.0 - (nx_normalized**2 + ny_normalized**2)
-                nz_squared = np.maximum(0.0, nz_squared)  # Clamp to prevent negative values
-                nz_normalized = np.sqrt(nz_squared)
-                
-                normal_z = ((nz_normalized + 1.0) / 2.0 * 255).astype(np.uint8)
+            # AO (blue) and height (alpha) have no Bedrock equivalent
+            normal_x, normal_y, _, _ = _read_bands(normal_path)
+            
+            bedrock_normal = np.empty(normal_x.shape + (3,), dtype=np.uint8)
+            
+            if _pbr_kernels is not None and normal_x.size >= NUMBA_MIN_PIXELS:
+                _pbr_kernels.normal_to_bedrock(normal_x, normal_y, self._normal_z_lut, bedrock_normal)
+            else:
+                # Reconstruct Z = sqrt(1 - x^2 - y^2) with one table lookup per pixel, building
+                # the index in place so only one temporary array is allocated
+                lut_index = normal_x.astype(np.uint16)
+                lut_index <<= 8
+                lut_index |= normal_y
                 
-                bedrock_normal = np.zeros((normal_array.shape[0], normal_array.shape[1], 3), dtype=np.uint8)
                 bedrock_normal[:, :, 0] = normal_x  # Red = X
                 bedrock_normal[:, :, 1] = normal_y  # Green = Y
-                bedrock_normal[:, :, 2] = normal_z  # Blue = Z (reconstructed)
-                
-                normal_img_out = Image.fromarray(bedrock_normal, 'RGB')
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                normal_img_out.save(output_path)
-                
-                self.conversion_stats["normal_converted"] += 1
-                
-                logger.debug(f"Converted normal map: {normal_path.name} -> {output_path.name}")
-                return True
-                
+                np.take(self._normal_z_lut, lut_index, out=bedrock_normal[:, :, 2], mode='clip')  # Blue = Z (reconstructed)
+            
+            self._ensure_dir(output_path.parent)
+            self._write_png(output_path, bedrock_normal)
+            
+            self.conversion_stats["normal_converted"] += 1
+            
+            logger.debug(f"Converted normal map: {normal_path.name} -> {output_path.name}")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to convert normal map {normal_path}: {str(e)}")
             self.conversion_stats["errors"] += 1
             return False
     
+    def _ensure_dir(self, directory: Path):
+        """Create an output directory the first time it is used instead of on every write"""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def set_executor(self, executor: Optional[ThreadPoolExecutor]):
+        """Write output files on a shared thread pool from the next batch on, or on private threads if None"""
+        self._shared_executor = executor
+    
+    def start_writer(self):
+        """Write output files on background threads until flush() is called"""
+        if self._writer is None:
+            self._writer = self._shared_executor or ThreadPoolExecutor(max_workers=WRITER_THREADS)
+    
+    def flush(self, stop_writer: bool = True):
+        """Wait for queued writes, count the ones that failed and, by default, stop the writer threads"""
+        for path, future in self._pending_writes.items():
+            self._check_write(path, future)
+        self._pending_writes.clear()
+        
+        if not stop_writer:
+            return
+        
+        if self._writer is not None and self._writer is not self._shared_executor:
+            self._writer.shutdown(wait=True)
+        self._writer = None
+    
+    def _write_png(self, path: Path, rgb_array: np.ndarray):
+        """Write an RGB array as PNG, on the writer threads when they are running"""
+        # The array is freshly built for this texture and never touched again, so no copy is needed
+        self._write(path, _write_rgb, path, rgb_array)
+    
+    def _write(self, path: Path, write, *args):
+        """Call write(*args) to produce path, queued on the writer threads when they are running"""
+        if self._writer is None:
+            write(*args)
+            return
+        
+        # Several Java sets can map to one Bedrock name; finish the earlier write so the last one wins
+        previous = self._pending_writes.pop(path, None)
+        if previous is not None:
+            self._check_write(path, previous)
+        
+        self._pending_writes[path] = self._writer.submit(write, *args)
+    
+    def _check_write(self, path: Path, future: Future):
+        """Wait for one queued write and record it if it failed"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Failed to write {path}: {str(error)}")
+            self.conversion_stats["errors"] += 1
+    
     def create_texture_set_json(self, texture_name: str, output_dir: Path, 
                                has_mer: bool = False, has_normal: bool = False) -> bool:
         """
@@ -239,15 +414,13 @@ class PBRConverter:
             
             if not output_dir.name == "blocks":
                 blocks_dir = output_dir.parent.parent / "blocks"  # Go up to textures then down to blocks
-                blocks_dir.mkdir(parents=True, exist_ok=True)
                 json_path = blocks_dir / f"{texture_name}.texture_set.json"
             else:
                 json_path = output_dir / f"{texture_name}.texture_set.json"
             
-            json_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(json_path.parent)
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(texture_set, f, indent=2)
+            self._write(json_path, json_path.write_bytes, fast_json.dumps(texture_set))
             
             self.conversion_stats["texture_sets_created"] += 1
             
@@ -260,7 +433,7 @@ class PBRConverter:
             return False
     
     def convert_pbr_textures(self, java_textures_dir: Path, bedrock_textures_dir: Path, 
-                           texture_mappings: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+                           texture_mappings: Optional[Mapping[str, str]] = None) -> Dict[str, int]:
         """
         Convert all PBR textures from Java to Bedrock format
         Only creates files for textures that exist and have mappings
@@ -268,13 +441,17 @@ class PBRConverter:
         Args:
             java_textures_dir: Java textures directory
             bedrock_textures_dir: Bedrock textures output directory
-            texture_mappings: Optional dict of Java->Bedrock texture mappings
+            texture_mappings: Optional dict of Java->Bedrock texture mappings,
+                              defaulting to the ones given to the constructor
             
         Returns:
             Dict with conversion statistics
         """
         logger.info("Starting PBR texture conversion...")
         
+        if texture_mappings is None:
+            texture_mappings = self.texture_mappings
+        
         pbr_sets = self.detect_pbr_textures(java_textures_dir)
         
         if not pbr_sets:
@@ -283,9 +460,10 @@ class PBRConverter:
         
         logger.info(f"Converting {len(pbr_sets)} PBR texture sets...")
         
+        # Sets that map to the same Bedrock name write the same files, so they share one job
+        # and run in their original order, keeping the last-one-wins result deterministic
+        jobs: Dict[str, List[Tuple[str, Dict[str, Path]]]] = {}
         for set_name, components in pbr_sets.items():
-            logger.debug(f"Processing PBR set: {set_name}")
-            
             diffuse_name = f"{set_name}.png"
             if texture_mappings and diffuse_name in texture_mappings:
                 bedrock_diffuse_name = texture_mappings[diffuse_name]
@@ -293,39 +471,68 @@ class PBRConverter:
             else:
                 bedrock_base_name = set_name
             
+            jobs.setdefault(bedrock_base_name, []).append((set_name, components))
+        
+        job_args = [(bedrock_base_name, sets, bedrock_textures_dir) for bedrock_base_name, sets in jobs.items()]
+        
+        # Every output goes into blocks/, so create it once here rather than per file or per worker
+        blocks_dir = bedrock_textures_dir / "blocks"
+        blocks_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs = {blocks_dir}
+        
+        if len(job_args) < PARALLEL_MIN_JOBS:
+            self.start_writer()
+            try:
+                for bedrock_base_name, sets, _ in job_args:
+                    self._convert_sets(bedrock_base_name, sets, bedrock_textures_dir)
+            finally:
+                self.flush()
+        else:
+            workers = min(len(job_args), PBR_WORKERS)
+            totals = Counter()
+            # Workers are spawned, never forked: the parent already runs I/O threads and possibly
+            # the Numba thread pool, whose locks a forked child could inherit held
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_pbr_worker,
+                                     initargs=(blocks_dir,),
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for job_stats in executor.map(_convert_pbr_job, job_args, chunksize=4):
+                    totals.update(job_stats)
+            
+            for key, value in totals.items():
+                self.conversion_stats[key] += value
+        
+        logger.info(f"PBR conversion completed:")
+        logger.info(f"  Specular maps converted: {self.conversion_stats['specular_converted']}")
+        logger.info(f"  Normal maps converted: {self.conversion_stats['normal_converted']}")
+        logger.info(f"  MER maps generated: {self.conversion_stats['mer_generated']}")
+        logger.info(f"  Texture set JSONs created: {self.conversion_stats['texture_sets_created']}")
+        logger.info(f"  Errors: {self.conversion_stats['errors']}")
+        
+        return self.conversion_stats
+    
+    def _convert_sets(self, bedrock_base_name: str, sets: List[Tuple[str, Dict[str, Path]]],
+                      bedrock_textures_dir: Path):
+        """Convert the PBR sets that share one Bedrock base name, in order"""
+        blocks_dir = bedrock_textures_dir / "blocks"
+        
+        for set_name, components in sets:
+            logger.debug(f"Processing PBR set: {set_name}")
+            
             has_mer = False
             has_normal = False
             
             if 'specular' in components:
-                specular_path = components['specular']
-                
-                mer_filename = f"{bedrock_base_name}_mer.png"
-                mer_path = bedrock_textures_dir / "blocks" / mer_filename
-                
-                if self.convert_specular_to_mer(specular_path, mer_path):
+                mer_path = blocks_dir / f"{bedrock_base_name}_mer.png"
+                if self.convert_specular_to_mer(components['specular'], mer_path):
                     has_mer = True
             
             if 'normal' in components:
-                normal_path = components['normal']
-                
-                normal_filename = f"{bedrock_base_name}_normal.png"
-                normal_out_path = bedrock_textures_dir / "blocks" / normal_filename
-                
-                if self.convert_normal_map(normal_path, normal_out_path):
+                normal_out_path = blocks_dir / f"{bedrock_base_name}_normal.png"
+                if self.convert_normal_map(components['normal'], normal_out_path):
                     has_normal = True
             
             if has_mer or has_normal:
-                blocks_dir = bedrock_textures_dir / "blocks"
                 self.create_texture_set_json(bedrock_base_name, blocks_dir, has_mer, has_normal)
-        
-        logger.info(f"PBR conversion completed:")
-        logger.info(f"  Specular maps converted: {self.conversion_stats['specular_converted']}")
-        logger.info(f"  Normal maps converted: {self.conversion_stats['normal_converted']}")
-        logger.info(f"  MER maps generated: {self.conversion_stats['mer_generated']}")
-        logger.info(f"  Texture set JSONs created: {self.conversion_stats['texture_sets_created']}")
-        logger.info(f"  Errors: {self.conversion_stats['errors']}")
-        
-        return self.conversion_stats
     
     def generate_mer_from_individual_maps(self, metallic_path: Optional[Path] = None,
                                         emissive_path: Optional[Path] = None,
@@ -344,43 +551,26 @@ class PBRConverter:
             bool: True if generation successful
         """
         try:
-            reference_img = None
-            for path in [metallic_path, emissive_path, roughness_path]:
-                if path and path.exists():
-                    reference_img = Image.open(path)
-                    break
+            # MER channel for each map that exists: Red = Metalness, Green = Emissive, Blue = Roughness
+            sources = [(path, channel) for path, channel in
+                       [(metallic_path, 0), (emissive_path, 1), (roughness_path, 2)]
+                       if path and path.exists()]
             
-            if not reference_img:
+            if not sources:
                 logger.warning("No reference maps found for MER generation")
                 return False
             
-            width, height = reference_img.size
-            mer_array = np.zeros((height, width, 3), dtype=np.uint8)
-            
-            if metallic_path and metallic_path.exists():
-                with Image.open(metallic_path) as metallic_img:
-                    if metallic_img.mode != 'L':
-                        metallic_img = ImageOps.grayscale(metallic_img)
-                    metallic_array = np.array(metallic_img)
-                    mer_array[:, :, 0] = metallic_array
-            
-            if emissive_path and emissive_path.exists():
-                with Image.open(emissive_path) as emissive_img:
-                    if emissive_img.mode != 'L':
-                        emissive_img = ImageOps.grayscale(emissive_img)
-                    emissive_array = np.array(emissive_img)
-                    mer_array[:, :, 1] = emissive_array
-            
-            if roughness_path and roughness_path.exists():
-                with Image.open(roughness_path) as roughness_img:
-                    if roughness_img.mode != 'L':
-                        roughness_img = ImageOps.grayscale(roughness_img)
-                    roughness_array = np.array(roughness_img)
-                    mer_array[:, :, 2] = roughness_array
-            
-            mer_img = Image.fromarray(mer_array, 'RGB')
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            mer_img.save(output_path)
+            # Each map is opened once; the first one found sets the output size
+            mer_array = None
+            for path, channel in sources:
+                with Image.open(path) as img:
+                    if mer_array is None:
+                        width, height = img.size
+                        mer_array = np.zeros((height, width, 3), dtype=np.uint8)
+                    mer_array[:, :, channel] = _grayscale_band(img)
+            
+            self._ensure_dir(output_path.parent)
+            _write_rgb(output_path, mer_array)
             
             logger.debug(f"Generated MER map: {output_path.name}")
             return True
@@ -3,24 +3,93 @@ Texture converter module for JE2BE converter
 Handles the actual texture conversion and file management
 """
 
-import shutil
+import os
 import logging
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from utils.mapping_loader import MappingLoader
+from utils.file_ops import fast_copy, iter_files
 
 logger = logging.getLogger(__name__)
 
+# Copies block in the kernel, so more threads than cores keep the disk queue full
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Copies queued at once per category, so huge packs don't create a future per file up front
+MAX_PENDING_COPIES = IO_WORKERS * 4
+
+# Statistic keys, in the order the conversion report lists them
+STAT_KEYS = ("converted", "skipped", "missing", "errors")
+
+def _new_stats() -> Counter:
+    """Zeroed statistics; every key is present so reports list all of them"""
+    return Counter(dict.fromkeys(STAT_KEYS, 0))
+
 class TextureConverter:
     """Handles texture conversion from Java to Bedrock format"""
     
+    # Java texture folders and the Bedrock folder (also used as the log label) they convert into
+    CATEGORIES = (
+        ("block", "blocks"),
+        ("item", "items"),
+        ("entity", "entity"),
+        ("environment", "environment"),
+        ("particle", "particle"),
+        ("colormap", "colormap"),
+        ("painting", "painting"),
+    )
+    
+    # Java name prefixes and the Bedrock prefix that replaces them for unmapped textures
+    _FALLBACK = {
+        "oak_": "",
+        "spruce_": "spruce_",
+        "birch_": "birch_",
+        "jungle_": "jungle_",
+        "acacia_": "acacia_",
+        "dark_oak_": "dark_oak_",
+        
+        "white_": "white_",
+        "orange_": "orange_",
+        "magenta_": "magenta_",
+        "light_blue_": "light_blue_",
+        "yellow_": "yellow_",
+        "lime_": "lime_",
+        "pink_": "pink_",
+        "gray_": "gray_",
+        "light_gray_": "silver_",
+        "cyan_": "cyan_",
+        "purple_": "purple_",
+        "blue_": "blue_",
+        "brown_": "brown_",
+        "green_": "green_",
+        "red_": "red_",
+        "black_": "black_",
+    }
+    
     def __init__(self, mappings_dir: str = "mappings"):
         self.mapping_loader = MappingLoader(mappings_dir)
         self.texture_mappings = self.mapping_loader.load_all_mappings()
         self.converted_files: Set[str] = set()
         self.missing_files: Set[str] = set()
         self.skipped_files: Set[str] = set()
+        # Thread pool for file copies, shared with the PBR converter's writes
+        self.executor = ThreadPoolExecutor(max_workers=IO_WORKERS)
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Stop the copy threads once the queued copies finish"""
+        self.executor.shutdown(wait=True)
+    
+    def set_executor(self, executor: ThreadPoolExecutor):
+        """Run copies on another thread pool, such as one shared with the other converters"""
+        self.executor = executor
+    
     def convert_textures(self, java_textures_dir: Path, bedrock_textures_dir: Path) -> Dict[str, int]:
         """
         Convert all textures from Java to Bedrock format
@@ -28,101 +97,95 @@ class TextureConverter:
         Returns:
             Dict with conversion statistics
         """
-        stats = {
-            "converted": 0,
-            "skipped": 0,
-            "missing": 0,
-            "errors": 0
-        }
+        stats = _new_stats()
         
         if not java_textures_dir.exists():
             logger.warning(f"Java textures directory not found: {java_textures_dir}")
-            return stats
-        
-        java_blocks = java_textures_dir / "block"
-        bedrock_blocks = bedrock_textures_dir / "blocks"
-        if java_blocks.exists():
-            block_stats = self._convert_texture_category(java_blocks, bedrock_blocks, "blocks")
-            for key, value in block_stats.items():
-                stats[key] += value
-        
-        java_items = java_textures_dir / "item"
-        bedrock_items = bedrock_textures_dir / "items"
-        if java_items.exists():
-            item_stats = self._convert_texture_category(java_items, bedrock_items, "items")
-            for key, value in item_stats.items():
-                stats[key] += value
-        
-        java_entity = java_textures_dir / "entity"
-        bedrock_entity = bedrock_textures_dir / "entity"
-        if java_entity.exists():
-            entity_stats = self._convert_texture_category(java_entity, bedrock_entity, "entity")
-            for key, value in entity_stats.items():
-                stats[key] += value
-        
-        java_env = java_textures_dir / "environment"
-        bedrock_env = bedrock_textures_dir / "environment"
-        if java_env.exists():
-            env_stats = self._convert_texture_category(java_env, bedrock_env, "environment")
-            for key, value in env_stats.items():
-                stats[key] += value
-        
-        java_particle = java_textures_dir / "particle"
-        bedrock_particle = bedrock_textures_dir / "particle"
-        if java_particle.exists():
-            particle_stats = self._convert_texture_category(java_particle, bedrock_particle, "particle")
-            for key, value in particle_stats.items():
-                stats[key] += value
-        
-        java_colormap = java_textures_dir / "colormap"
-        bedrock_colormap = bedrock_textures_dir / "colormap"
-        if java_colormap.exists():
-            colormap_stats = self._convert_texture_category(java_colormap, bedrock_colormap, "colormap")
-            for key, value in colormap_stats.items():
-                stats[key] += value
-        
-        java_painting = java_textures_dir / "painting"
-        bedrock_painting = bedrock_textures_dir / "painting"
-        if java_painting.exists():
-            painting_stats = self._convert_texture_category(java_painting, bedrock_painting, "painting")
-            for key, value in painting_stats.items():
-                stats[key] += value
+            return dict(stats)
+        
+        for java_name, bedrock_name in self.CATEGORIES:
+            java_category_dir = java_textures_dir / java_name
+            if java_category_dir.exists():
+                # update() rather than +=, which would drop the keys that are still zero
+                stats.update(self._convert_texture_category(java_category_dir, bedrock_textures_dir / bedrock_name, bedrock_name))
         
         if self.missing_files:
             self.mapping_loader.save_missing_mappings(list(self.missing_files))
         
-        return stats
+        return dict(stats)
     
-    def _convert_texture_category(self, java_dir: Path, bedrock_dir: Path, category: str) -> Dict[str, int]:
+    def _convert_texture_category(self, java_dir: Path, bedrock_dir: Path, category: str) -> Counter:
         """Convert textures in a specific category"""
-        stats = {
-            "converted": 0,
-            "skipped": 0,
-            "missing": 0,
-            "errors": 0
-        }
+        stats = _new_stats()
         
         bedrock_dir.mkdir(parents=True, exist_ok=True)
         
-        for file_path in java_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in ['.png', '.tga', '.jpg', '.jpeg']:
+        # Paths below are plain strings: a Path per file costs more than the rest of the loop
+        java_root = os.path.join(str(java_dir), '')
+        bedrock_root = str(bedrock_dir)
+        
+        # One listing of the output tree replaces an exists() call per texture; keys are
+        # normcased so the check stays case-insensitive on Windows like exists() was
+        existing = set()
+        for dirpath, dirnames, filenames in os.walk(bedrock_root):
+            relative_dir = dirpath[len(bedrock_root) + 1:]
+            for name in dirnames + filenames:
+                existing.add(os.path.normcase(os.path.join(relative_dir, name)))
+        
+        # Targets are resolved in walk order so the first texture claiming a name still wins;
+        # only the copies run on the pool, and their results are merged here without locking
+        pending = {}
+        for entry in iter_files(java_dir):
+            if os.path.splitext(entry.name)[1].lower() in ['.png', '.tga', '.jpg', '.jpeg']:
+                file_path = entry.path
                 try:
-                    result = self._convert_single_texture(file_path, java_dir, bedrock_dir, category)
-                    stats[result] += 1
+                    result, target_path = self._resolve_target(file_path, entry.name, java_root, bedrock_root, category, existing)
                 except Exception as e:
                     logger.error(f"Error converting {file_path}: {str(e)}")
                     stats["errors"] += 1
+                    continue
+                
+                if target_path is None:
+                    stats[result] += 1
+                    continue
+                
+                if len(pending) >= MAX_PENDING_COPIES:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._collect_copy(future, pending.pop(future), stats)
+                
+                future = self.executor.submit(self._convert_single_texture, file_path, target_path, category)
+                pending[future] = (file_path, target_path, result)
+        
+        for future in list(pending):
+            self._collect_copy(future, pending.pop(future), stats)
         
         logger.info(f"Converted {category}: {stats['converted']} files, {stats['skipped']} skipped, {stats['missing']} missing mappings")
         return stats
     
-    def _convert_single_texture(self, file_path: Path, java_dir: Path, bedrock_dir: Path, category: str) -> str:
-        """Convert a single texture file"""
-        relative_path = file_path.relative_to(java_dir)
-        original_name = file_path.name
+    def _collect_copy(self, future: Future, copy: Tuple[str, str, str], stats: Counter):
+        """Wait for one queued copy and count it"""
+        file_path, target_path, result = copy
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Error converting {file_path}: {str(e)}")
+            stats["errors"] += 1
+            return
+        
+        self.converted_files.add(target_path)
+        stats[result] += 1
+    
+    def _resolve_target(self, file_path: str, original_name: str, java_root: str, bedrock_dir: str, category: str,
+                        existing: Set[str]) -> Tuple[str, Optional[str]]:
+        """
+        Pick the Bedrock path for a texture, or None when it is skipped, plus the stat it counts as
+        java_root ends with a separator, so what lies between it and the file name is the relative folder
+        """
+        relative_dir = file_path[len(java_root):len(file_path) - len(original_name)]
         
         if original_name.endswith('_n.png') or original_name.endswith('_s.png'):
-            return "skipped"
+            return "skipped", None
         
         mapped_name = self.texture_mappings.get(original_name, None)
         
@@ -132,57 +195,48 @@ class TextureConverter:
                 self.missing_files.add(original_name)
                 logger.debug(f"No mapping found for {original_name}, using original name")
         
-        new_relative_path = relative_path.parent / mapped_name
-        target_path = bedrock_dir / new_relative_path
+        new_relative_path = relative_dir + mapped_name
+        target_path = os.path.join(bedrock_dir, new_relative_path)
+        target_key = os.path.normcase(new_relative_path)
         
-        if target_path.exists():
-            self.skipped_files.add(str(target_path))
-            return "skipped"
+        if target_key in existing:
+            self.skipped_files.add(target_path)
+            return "skipped", None
         
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        existing.add(target_key)
+        return ("converted" if mapped_name != original_name else "missing"), target_path
+    
+    def _convert_single_texture(self, file_path: str, target_path: str, category: str):
+        """Copy a single texture to its resolved Bedrock path"""
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
         
-        shutil.copy2(file_path, target_path)
-        self.converted_files.add(str(target_path))
+        fast_copy(file_path, target_path)
         
-        logger.debug(f"Converted {category}: {original_name} -> {mapped_name}")
-        return "converted" if mapped_name != original_name else "missing"
+        logger.debug(f"Converted {category}: {os.path.basename(file_path)} -> {os.path.basename(target_path)}")
     
     def _get_fallback_mapping(self, texture_name: str, category: str) -> str:
         """Get fallback mapping for unmapped textures"""
         if texture_name.startswith("minecraft_"):
             texture_name = texture_name[10:]
         
-        fallback_patterns = {
-            "oak_": "",
-            "spruce_": "spruce_",
-            "birch_": "birch_",
-            "jungle_": "jungle_",
-            "acacia_": "acacia_",
-            "dark_oak_": "dark_oak_",
-            
-            "white_": "white_",
-            "orange_": "orange_",
-            "magenta_": "magenta_",
-            "light_blue_": "light_blue_",
-            "yellow_": "yellow_",
-            "lime_": "lime_",
-            "pink_": "pink_",
-            "gray_": "gray_",
-            "light_gray_": "silver_",
-            "cyan_": "cyan_",
-            "purple_": "purple_",
-            "blue_": "blue_",
-            "brown_": "brown_",
-            "green_": "green_",
-            "red_": "red_",
-            "black_": "black_",
-        }
+        # No pattern is a prefix of another, so at most one can match: try the first
+        # word of the name, then the first two words (dark_oak_, light_gray_, ...)
+        first = texture_name.find('_')
+        if first < 0:
+            return texture_name
         
-        for pattern, replacement in fallback_patterns.items():
-            if texture_name.startswith(pattern):
-                return texture_name.replace(pattern, replacement, 1)
+        prefix = texture_name[:first + 1]
+        replacement = self._FALLBACK.get(prefix)
+        if replacement is None:
+            second = texture_name.find('_', first + 1)
+            if second < 0:
+                return texture_name
+            prefix = texture_name[:second + 1]
+            replacement = self._FALLBACK.get(prefix)
+            if replacement is None:
+                return texture_name
         
-        return texture_name
+        return replacement + texture_name[len(prefix):]
     
     def get_conversion_report(self) -> Dict[str, any]:
         """Get detailed conversion report"""
@@ -197,11 +251,15 @@ class TextureConverter:
     
     def reload_mappings(self):
         """Reload mappings from files (useful for development)"""
+        self.mapping_loader.invalidate()
         self.texture_mappings = self.mapping_loader.load_all_mappings()
         logger.info(f"Reloaded {len(self.texture_mappings)} texture mappings")
     
     def add_custom_mapping(self, java_name: str, bedrock_name: str):
         """Add a custom mapping at runtime"""
+        # The loader hands out a read-only view, so the first custom mapping switches to a private copy
+        if not isinstance(self.texture_mappings, dict):
+            self.texture_mappings = dict(self.texture_mappings)
         self.texture_mappings[java_name] = bedrock_name
         logger.debug(f"Added custom mapping: {java_name} -> {bedrock_name}")
     
@@ -217,15 +275,14 @@ class TextureConverter:
         if not bedrock_dir.exists():
             return issues
         
-        for texture_file in bedrock_dir.rglob("*"):
-            if texture_file.is_file():
-                file_size = texture_file.stat().st_size
-                if file_size == 0:
-                    issues["empty_files"].append(str(texture_file))
-                elif file_size > 1024 * 1024:  # > 1MB
-                    issues["large_files"].append(str(texture_file))
-                
-                if texture_file.suffix.lower() not in ['.png', '.tga', '.jpg', '.jpeg']:
-                    issues["wrong_extensions"].append(str(texture_file))
+        for entry in iter_files(bedrock_dir):
+            file_size = entry.stat().st_size
+            if file_size == 0:
+                issues["empty_files"].append(entry.path)
+            elif file_size > 1024 * 1024:  # > 1MB
+                issues["large_files"].append(entry.path)
+            
+            if os.path.splitext(entry.name)[1].lower() not in ['.png', '.tga', '.jpg', '.jpeg']:
+                issues["wrong_extensions"].append(entry.path)
         
         return issues
@@ -4,19 +4,20 @@ Minecraft Java Edition to Bedrock Edition Resource Pack Converter
 """
 
 import os
-import json
 import sys
-import shutil
 import logging
 import argparse
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from utils.mapping_loader import MappingLoader
 from utils.pack_manager import PackManager
-from converters.texture_converter import TextureConverter
+from converters.texture_converter import IO_WORKERS, TextureConverter
 from converters.bedrock_generator import BedrockStructureGenerator
 from converters.pbr_converter import PBRConverter
+from utils import fast_json
+from utils.file_ops import fast_copy, iter_files
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,8 +28,10 @@ logging.basicConfig(
     ]
 )
 
+# StreamHandler flushes after every record, so progress shows up as it happens without explicit
+# flushes; line buffering also covers anything printed straight to stdout
 for handler in logging.getLogger().handlers:
-    if hasattr(handler, 'stream'):
+    if hasattr(getattr(handler, 'stream', None), 'reconfigure'):
         handler.stream.reconfigure(line_buffering=True)
 
 logger = logging.getLogger(__name__)
@@ -37,13 +40,16 @@ class JE2BEConverter:
     
     def __init__(self, mappings_dir: str = "mappings"):
         self.mappings_dir = mappings_dir
-        self.mapping_loader = MappingLoader(mappings_dir)
-        self.pack_manager = PackManager()
         self.texture_converter = TextureConverter(mappings_dir)
+        self.pack_manager = PackManager(io_executor=self.texture_converter.executor)
         self.bedrock_generator = BedrockStructureGenerator()
-        self.pbr_converter = PBRConverter()
         
-        self.texture_mappings = self.mapping_loader.load_all_mappings()
+        # The texture converter has already loaded the mappings; share them instead of parsing again
+        self.mapping_loader = self.texture_converter.mapping_loader
+        self.texture_mappings = self.texture_converter.texture_mappings
+        self.pbr_converter = PBRConverter(io_executor=self.texture_converter.executor,
+                                          texture_mappings=self.texture_mappings)
+        
         logger.info(f"Initialized converter with {len(self.texture_mappings)} texture mappings")
     
     def convert_resource_pack(self, input_path: str, output_path: str, 
@@ -51,16 +57,20 @@ class JE2BEConverter:
                             validate_input: bool = True, enable_pbr: bool = True, 
                             essentials: bool = False, rtxfix: bool = False) -> bool:
         try:
+            # Each conversion shares one fresh I/O pool between the converters; close() stops it again
+            self._set_io_executor(ThreadPoolExecutor(max_workers=IO_WORKERS))
+            # Validation, extraction, pack info and asset copies share one open input zip;
+            # cleanup_temp_directories in the finally closes it
+            self.pack_manager.keep_zips_open()
+            
             logger.info(f"Starting conversion of {input_path}")
             
             logger.info("Validating input pack...")
-            sys.stdout.flush()
             if validate_input:
                 if not self._validate_input_pack(input_path):
                     return False
             
             logger.info("Preparing workspace...")
-            sys.stdout.flush()
             temp_dir = self.pack_manager.create_temp_directory("je2be_conversion")
             java_temp = temp_dir / "java_extracted"
             bedrock_temp = temp_dir / "bedrock_build"
@@ -69,7 +79,6 @@ class JE2BEConverter:
             bedrock_temp.mkdir(exist_ok=True)
             
             logger.info("Extracting Java pack...")
-            sys.stdout.flush()
             minecraft_dir = self.pack_manager.extract_java_pack(input_path, java_temp)
             if not minecraft_dir:
                 return False
@@ -84,14 +93,12 @@ class JE2BEConverter:
             logger.info(f"Original pack has {pack_info['texture_count']} textures in categories: {', '.join(pack_info['categories'])}")
             
             logger.info("Creating Bedrock structure...")
-            sys.stdout.flush()
             self.bedrock_generator.create_bedrock_structure(bedrock_temp)
             if not self.bedrock_generator.generate_manifest(bedrock_temp, pack_name, pack_description, enable_pbr=enable_pbr):
                 logger.error("Failed to generate manifest.json")
                 return False
             
             logger.info("Converting textures...")
-            sys.stdout.flush()
             java_textures_dir = minecraft_dir / "textures"
             bedrock_textures_dir = bedrock_temp / "textures"
             
@@ -102,18 +109,15 @@ class JE2BEConverter:
                 logger.info("Processing PBR textures...")
             else:
                 logger.info("Skipping PBR conversion...")
-            sys.stdout.flush()
             pbr_stats = {}
             if enable_pbr:
-                pbr_stats = self.pbr_converter.convert_pbr_textures(java_textures_dir, bedrock_textures_dir, self.texture_mappings)
+                pbr_stats = self.pbr_converter.convert_pbr_textures(java_textures_dir, bedrock_textures_dir)
                 self._log_pbr_stats(pbr_stats)
             
             logger.info("Validating missing mappings...")
-            sys.stdout.flush()
             self._validate_missing_mappings(java_textures_dir)
             
             logger.info("Copying required files...")
-            sys.stdout.flush()
             
             self.bedrock_generator.generate_terrain_texture_json(bedrock_temp, "converted_pack")
             self.bedrock_generator.generate_item_texture_json(bedrock_temp, "converted_pack")
@@ -127,15 +131,12 @@ class JE2BEConverter:
             
             if essentials:
                 logger.info("Copying essentials files...")
-                sys.stdout.flush()
                 self._copy_essentials(bedrock_temp)
             if rtxfix:
                 logger.info("Applying RTX fixes...")
-                sys.stdout.flush()
                 self._apply_rtxfix(bedrock_temp)
             
             logger.info("Creating .mcpack file...")
-            sys.stdout.flush()
             if not self.pack_manager.create_mcpack(bedrock_temp, output_path):
                 logger.error("Failed to create .mcpack file")
                 return False
@@ -154,6 +155,26 @@ class JE2BEConverter:
             return False
         finally:
             self.pack_manager.cleanup_temp_directories()
+            # After the cleanup, which deletes the temp files on the same pool
+            self.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Stop the I/O threads shared by the converters, once their queued work is done"""
+        self.texture_converter.close()
+    
+    def _set_io_executor(self, executor: ThreadPoolExecutor):
+        """Hand one thread pool to every part that copies or writes files, stopping the pool it replaces"""
+        previous = self.texture_converter.executor
+        self.texture_converter.set_executor(executor)
+        self.pack_manager.set_executor(executor)
+        self.pbr_converter.set_executor(executor)
+        previous.shutdown(wait=True)
     
     def _validate_input_pack(self, input_path: str) -> bool:
         """Validate the input Java resource pack"""
@@ -211,45 +232,48 @@ class JE2BEConverter:
         try:
             report_path = Path(output_path).parent / "conversion_report.txt"
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("=== JE2BE Conversion Report ===\n\n")
-                f.write(f"Output pack: {output_path}\n")
-                f.write(f"PBR enabled: {pbr_enabled}\n")
-                f.write(f"Total mappings available: {len(self.texture_mappings)}\n\n")
-                
-                f.write("Texture Conversion Statistics:\n")
-                for stat_type, count in conversion_stats.items():
-                    f.write(f"  {stat_type}: {count}\n")
-                
-                if pbr_enabled and pbr_stats:
-                    f.write("\nPBR Conversion Statistics:\n")
-                    for stat_type, count in pbr_stats.items():
-                        f.write(f"  {stat_type}: {count}\n")
-                
-                f.write("\nAsset Copy Statistics:\n")
-                for asset_type, count in asset_stats.items():
-                    if count > 0:
-                        f.write(f"  {asset_type}: {count}\n")
-                
-                conversion_report = self.texture_converter.get_conversion_report()
-                f.write(f"\nDetailed Conversion Info:\n")
-                f.write(f"  Files with missing mappings: {conversion_report['missing_mappings']}\n")
-                
-                if conversion_report['missing_files_list']:
-                    f.write("\nTextures without mappings (first 20):\n")
-                    for missing_file in conversion_report['missing_files_list'][:20]:
-                        f.write(f"  - {missing_file}\n")
-                
-                f.write(f"\nMapping categories loaded:\n")
-                for category in self.mapping_loader.get_categories():
-                    category_mappings = self.mapping_loader.get_mapping_by_category(category)
-                    f.write(f"  {category}: {len(category_mappings)} mappings\n")
-                
-                if pbr_enabled:
-                    pbr_report = self.pbr_converter.get_conversion_report()
-                    f.write(f"\nPBR Support Features:\n")
-                    for feature, supported in pbr_report['supported_features'].items():
-                        f.write(f"  {feature}: {'Yes' if supported else 'No'}\n")
+            # Collected in memory and written with a single call instead of one write per line
+            parts = []
+            parts.append("=== JE2BE Conversion Report ===\n\n")
+            parts.append(f"Output pack: {output_path}\n")
+            parts.append(f"PBR enabled: {pbr_enabled}\n")
+            parts.append(f"Total mappings available: {len(self.texture_mappings)}\n\n")
+            
+            parts.append("Texture Conversion Statistics:\n")
+            for stat_type, count in conversion_stats.items():
+                parts.append(f"  {stat_type}: {count}\n")
+            
+            if pbr_enabled and pbr_stats:
+                parts.append("\nPBR Conversion Statistics:\n")
+                for stat_type, count in pbr_stats.items():
+                    parts.append(f"  {stat_type}: {count}\n")
+            
+            parts.append("\nAsset Copy Statistics:\n")
+            for asset_type, count in asset_stats.items():
+                if count > 0:
+                    parts.append(f"  {asset_type}: {count}\n")
+            
+            conversion_report = self.texture_converter.get_conversion_report()
+            parts.append(f"\nDetailed Conversion Info:\n")
+            parts.append(f"  Files with missing mappings: {conversion_report['missing_mappings']}\n")
+            
+            if conversion_report['missing_files_list']:
+                parts.append("\nTextures without mappings (first 20):\n")
+                for missing_file in conversion_report['missing_files_list'][:20]:
+                    parts.append(f"  - {missing_file}\n")
+            
+            parts.append(f"\nMapping categories loaded:\n")
+            for category in self.mapping_loader.get_categories():
+                category_mappings = self.mapping_loader.get_mapping_by_category(category)
+                parts.append(f"  {category}: {len(category_mappings)} mappings\n")
+            
+            if pbr_enabled:
+                pbr_report = self.pbr_converter.get_conversion_report()
+                parts.append(f"\nPBR Support Features:\n")
+                for feature, supported in pbr_report['supported_features'].items():
+                    parts.append(f"  {feature}: {'Yes' if supported else 'No'}\n")
+            
+            report_path.write_text("".join(parts), encoding='utf-8')
             
             logger.info(f"Conversion report saved to: {report_path}")
             
@@ -289,40 +313,37 @@ class JE2BEConverter:
             Dict mapping texture names to whether they're actually missing
         """
         try:
-            missing_file = Path("missing_mappings.json")
-            if not missing_file.exists():
+            # Read straight away rather than exists() first; the file is usually there
+            try:
+                missing_mappings = fast_json.loads(Path("missing_mappings.json").read_bytes())
+            except FileNotFoundError:
                 logger.info("No missing_mappings.json file found")
                 return {}
             
-            with open(missing_file, 'r') as f:
-                missing_mappings = json.load(f)
-            
             validation_results = {}
             actually_missing = []
             code_issues = []
             
+            # One walk of the pack indexes every PNG by file name, keeping the first one rglob would find,
+            # instead of a recursive search (plus six stat calls) per missing texture; the index holds
+            # plain path strings so no Path object is built per file
+            png_index = {}
+            if missing_mappings:
+                for entry in iter_files(java_textures_dir):
+                    name = os.path.normcase(entry.name)
+                    if name.endswith('.png'):
+                        png_index.setdefault(name, entry.path)
+            
             for texture_name in missing_mappings:
-                possible_paths = [
-                    java_textures_dir / f"{texture_name}.png",
-                    java_textures_dir / "block" / f"{texture_name}.png",
-                    java_textures_dir / "item" / f"{texture_name}.png",
-                    java_textures_dir / "entity" / f"{texture_name}.png",
-                    java_textures_dir / "models" / f"{texture_name}.png",
-                    java_textures_dir / "gui" / f"{texture_name}.png",
-                ]
+                first_match = png_index.get(os.path.normcase(f"{texture_name}.png"))
                 
-                recursive_matches = list(java_textures_dir.rglob(f"{texture_name}.png"))
-                
-                texture_exists = any(path.exists() for path in possible_paths) or bool(recursive_matches)
+                texture_exists = first_match is not None
                 validation_results[texture_name] = texture_exists
                 
                 if texture_exists:
                     code_issues.append(texture_name)
-                    if recursive_matches:
-                        found_path = recursive_matches[0].relative_to(java_textures_dir)
-                        logger.warning(f"⚠️  Texture '{texture_name}' found at '{found_path}' but not converted - possible mapping issue")
-                    else:
-                        logger.warning(f"⚠️  Texture '{texture_name}' exists in pack but marked as missing - possible mapping issue")
+                    found_path = os.path.relpath(first_match, java_textures_dir)
+                    logger.warning(f"⚠️  Texture '{texture_name}' found at '{found_path}' but not converted - possible mapping issue")
                 else:
                     actually_missing.append(texture_name)
             
@@ -356,20 +377,32 @@ class JE2BEConverter:
         copied_count = 0
         skipped_count = 0
         
-        for file_path in essentials_dir.iterdir():
-            if file_path.is_file():
-                dest_path = blocks_dir / file_path.name
+        # One listing of the destination replaces an exists() call per file
+        existing = {os.path.normcase(name) for name in os.listdir(blocks_dir)}
+        
+        # Copies are independent, so they run on the shared I/O pool; results are counted here
+        executor = self.texture_converter.executor
+        copies = {}
+        with os.scandir(essentials_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
                 
-                if dest_path.exists():
-                    logger.debug(f"Skipping {file_path.name} - already exists")
+                if os.path.normcase(entry.name) in existing:
+                    logger.debug(f"Skipping {entry.name} - already exists")
                     skipped_count += 1
                 else:
-                    try:
-                        shutil.copy2(file_path, dest_path)
-                        logger.debug(f"Copied essential file: {file_path.name}")
-                        copied_count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to copy {file_path.name}: {str(e)}")
+                    future = executor.submit(fast_copy, entry.path, os.path.join(blocks_dir, entry.name))
+                    copies[future] = entry.name
+        
+        for future in as_completed(copies):
+            name = copies[future]
+            try:
+                future.result()
+                logger.debug(f"Copied essential file: {name}")
+                copied_count += 1
+            except Exception as e:
+                logger.warning(f"Failed to copy {name}: {str(e)}")
         
         logger.info(f"Essentials: copied {copied_count} files, skipped {skipped_count} existing files")
     
@@ -383,32 +416,41 @@ class JE2BEConverter:
         copied_count = 0
         replaced_count = 0
         
-        def copy_recursive(src_dir: Path, dest_dir: Path):
-            nonlocal copied_count, replaced_count
-            
-            for item in src_dir.iterdir():
-                dest_item = dest_dir / item.name
-                
-                if item.is_file():
-                    try:
-                        dest_item.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        if dest_item.exists():
-                            replaced_count += 1
-                            logger.debug(f"Replacing file: {item.relative_to(rtxfix_dir)}")
-                        else:
-                            copied_count += 1
-                            logger.debug(f"Adding file: {item.relative_to(rtxfix_dir)}")
-                        
-                        shutil.copy2(item, dest_item)
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to copy {item.relative_to(rtxfix_dir)}: {str(e)}")
+        # Destination directories are created while walking, so the queued copies never race a mkdir
+        executor = self.texture_converter.executor
+        copies = {}
+        for src_root, _, file_names in os.walk(rtxfix_dir):
+            if not file_names:
+                continue
+            
+            relative_root = os.path.relpath(src_root, rtxfix_dir)
+            dest_root = os.path.normpath(os.path.join(bedrock_temp, relative_root))
+            
+            try:
+                os.makedirs(dest_root, exist_ok=True)
+                existing = {os.path.normcase(name) for name in os.listdir(dest_root)}
+            except Exception as e:
+                logger.warning(f"Failed to copy {relative_root}: {str(e)}")
+                continue
+            
+            for file_name in file_names:
+                relative_file = os.path.normpath(os.path.join(relative_root, file_name))
+                if os.path.normcase(file_name) in existing:
+                    replaced_count += 1
+                    logger.debug(f"Replacing file: {relative_file}")
+                else:
+                    copied_count += 1
+                    logger.debug(f"Adding file: {relative_file}")
                 
-                elif item.is_dir():
-                    copy_recursive(item, dest_item)
+                future = executor.submit(fast_copy, os.path.join(src_root, file_name), os.path.join(dest_root, file_name))
+                copies[future] = relative_file
+        
+        for future in as_completed(copies):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Failed to copy {copies[future]}: {str(e)}")
         
-        copy_recursive(rtxfix_dir, bedrock_temp)
         logger.info(f"RTXfix: added {copied_count} files, replaced {replaced_count} files")
 
 def main():
@@ -495,4 +537,6 @@ Examples:
         return 1
 
 if __name__ == "__main__":
+    # Lets frozen Windows builds start PBR worker processes without re-running the CLI
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Bake the texture mapping files for JE2BE converter
+Packs every mappings/*.json into one Zstandard-compressed msgpack blob that MappingLoader reads in a single pass
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import msgpack
+import zstandard
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.mapping_loader import BAKED_MAPPINGS_NAME
+
+def bake_mappings(mappings_dir: Path) -> Path:
+    """Write the blob next to the mapping files and return its path"""
+    baked = {}
+    for mapping_file in sorted(mappings_dir.glob("*.json")):
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            baked[mapping_file.name] = json.load(f)
+
+    baked_path = mappings_dir / BAKED_MAPPINGS_NAME
+    baked_path.write_bytes(zstandard.ZstdCompressor(level=9).compress(msgpack.packb(baked)))
+
+    print(f"Baked {len(baked)} mapping files into {baked_path} ({baked_path.stat().st_size / 1024:.1f} KB)")
+    return baked_path
+
+def main():
+    mappings_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / "mappings"
+    if not mappings_dir.is_dir():
+        print(f"Mappings directory not found: {mappings_dir}")
+        return 1
+
+    bake_mappings(mappings_dir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Regression check for JE2BE converter
+Runs two conversions on one JE2BEConverter in a child process and fails if it does not exit in time:
+a small pack whose PBR maps go through the serial path (and the Numba kernels) in the parent,
+then a larger one that starts the PBR worker processes
+"""
+
+import sys
+import json
+import zipfile
+import tempfile
+import subprocess
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# Seconds the child may take for both conversions and interpreter exit
+TIMEOUT = 300
+
+def build_pack(pack_path: Path, set_count: int, size: int):
+    """Write a Java pack with set_count block textures, each with a specular and a normal map"""
+    mappings = {}
+    for mapping_file in sorted((REPO_ROOT / "mappings").glob("*.json")):
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            mappings.update(json.load(f).get("mappings", {}))
+    # Sets that map to the same Bedrock name share one PBR job, so each set gets its own
+    names = []
+    bedrock_names = set()
+    for name in sorted(mappings):
+        if name.endswith('.png') and mappings[name] not in bedrock_names:
+            bedrock_names.add(mappings[name])
+            names.append(name)
+    names = names[:set_count]
+
+    rng = np.random.default_rng(set_count)
+    with zipfile.ZipFile(pack_path, 'w') as zipf:
+        zipf.writestr("pack.mcmeta", json.dumps({"pack": {"pack_format": 15, "description": pack_path.stem}}))
+        for name in names:
+            stem = name[:-4]
+            for suffix in ("", "_s", "_n"):
+                image = Image.fromarray(rng.integers(0, 256, (size, size, 4), dtype=np.uint8), "RGBA")
+                data = BytesIO()
+                image.save(data, "PNG")
+                zipf.writestr(f"assets/minecraft/textures/block/{stem}{suffix}.png", data.getvalue())
+
+def run_conversions(packs, output_dir: Path) -> int:
+    """Child process: convert every pack with the same converter"""
+    from je2be_converter import JE2BEConverter
+
+    converter = JE2BEConverter(str(REPO_ROOT / "mappings"))
+    for pack in packs:
+        output = output_dir / (Path(pack).stem + ".mcpack")
+        if not converter.convert_resource_pack(pack, str(output)):
+            print(f"Conversion failed: {pack}")
+            return 1
+    return 0
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        return run_conversions(sys.argv[3:], Path(sys.argv[2]))
+
+    with tempfile.TemporaryDirectory(prefix="je2be_check_") as work_dir:
+        work_dir = Path(work_dir)
+        serial_pack = work_dir / "serial_pack.zip"
+        parallel_pack = work_dir / "parallel_pack.zip"
+        # Fewer sets than PARALLEL_MIN_JOBS, at the size that switches the PBR maths to Numba
+        build_pack(serial_pack, 4, 256)
+        build_pack(parallel_pack, 20, 16)
+
+        command = [sys.executable, str(Path(__file__).resolve()), "--child", str(work_dir),
+                   str(serial_pack), str(parallel_pack)]
+        try:
+            # The child runs in the temp folder so its log and missing_mappings.json stay out of the repo
+            result = subprocess.run(command, cwd=work_dir, timeout=TIMEOUT,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        except subprocess.TimeoutExpired:
+            print(f"FAIL: two conversions in one process did not exit within {TIMEOUT}s")
+            return 1
+
+    if result.returncode != 0:
+        print(f"FAIL: child exited with {result.returncode}\n{result.stderr}")
+        return 1
+
+    print("OK: two conversions in one process finished and exited")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
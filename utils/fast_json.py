@@ -0,0 +1,29 @@
+"""
+Fast JSON helpers for JE2BE converter
+Uses orjson when it is installed and falls back to the standard library json module
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes, pretty-printed with 2 spaces by default"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
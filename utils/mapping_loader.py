@@ -3,22 +3,71 @@ Mapping loader utility for JE2BE converter
 Loads and manages texture mappings from JSON files
 """
 
-import json
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from utils import fast_json
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = None
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Mapping files are small, so a few threads are enough to overlap their reads
+MAX_PARSE_WORKERS = 8
+
+# Every mapping file packed into one blob by tools/bake_mappings.py
+BAKED_MAPPINGS_NAME = "mappings.msgpack.zst"
+
+# Parsed mappings per directory, shared by every loader in the process:
+# resolved dir -> (file signature, combined mappings, per-category data)
+_mappings_cache: Dict[str, Tuple[tuple, Dict[str, str], Dict[str, Any]]] = {}
+
+def _mappings_signature(mapping_files: List[Path]) -> tuple:
+    """Name, size and modification time of each file, in load order; any edit changes it"""
+    signature = []
+    for mapping_file in mapping_files:
+        stat = mapping_file.stat()
+        signature.append((mapping_file.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
 class MappingLoader:
     """Utility class to load and manage texture mappings"""
     
     def __init__(self, mappings_dir: str = "mappings"):
         self.mappings_dir = Path(mappings_dir)
         self.loaded_mappings = {}
+        # Combined mappings from the first load_all_mappings call, until invalidate()
+        self._combined_cache: Optional[Dict[str, str]] = None
+        self._combined_view: Optional[Mapping[str, str]] = None
         
-    def load_all_mappings(self) -> Dict[str, str]:
-        """Load all mapping files and combine them into a single dictionary"""
+    def load_all_mappings(self) -> Mapping[str, str]:
+        """Load all mapping files and combine them into a single read-only mapping"""
+        # The cached dict is shared, so callers get a view instead of a copy; dict(...) it to make changes
+        if self._combined_view is None:
+            self._combined_view = MappingProxyType(self._all_mappings())
+        return self._combined_view
+    
+    def invalidate(self):
+        """Forget the combined mappings so the next call reads the mapping files again"""
+        self._combined_cache = None
+        self._combined_view = None
+    
+    def _all_mappings(self) -> Dict[str, str]:
+        """Combined mappings for read-only use, loaded on first access"""
+        if self._combined_cache is None:
+            self._combined_cache = self._read_all_mappings()
+        return self._combined_cache
+    
+    def _read_all_mappings(self) -> Dict[str, str]:
+        """Read and combine every mapping file, reusing another loader's parse when the files are unchanged"""
         combined_mappings = {}
         
         if not self.mappings_dir.exists():
@@ -31,41 +80,101 @@ class MappingLoader:
             logger.warning(f"No mapping files found in {self.mappings_dir}")
             return combined_mappings
         
+        cache_key = str(self.mappings_dir.resolve())
+        signature = _mappings_signature(mapping_files)
+        cached = _mappings_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            logger.debug(f"Using cached mappings for {self.mappings_dir}")
+            self.loaded_mappings.update(cached[2])
+            return cached[1]
+        
         logger.info(f"Loading {len(mapping_files)} mapping files...")
         
+        parsed = self._read_baked_mappings(mapping_files, signature)
+        if parsed is None:
+            parsed = self._parse_mapping_files(mapping_files)
+        
+        loaded_categories = {}
         for mapping_file in mapping_files:
             try:
-                category_mappings = self.load_mapping_file(mapping_file)
+                parsed_file = parsed[mapping_file.name]
+                if parsed_file is None:
+                    continue
+                category, category_mappings = parsed_file
+                self.loaded_mappings[category] = category_mappings
                 if category_mappings:
                     mappings = category_mappings.get("mappings", {})
                     combined_mappings.update(mappings)
                     
-                    category = category_mappings.get("category", mapping_file.stem)
+                    loaded_categories[category] = category_mappings
                     logger.debug(f"Loaded {len(mappings)} mappings from {category}")
                     
             except Exception as e:
                 logger.error(f"Failed to load mapping file {mapping_file}: {str(e)}")
         
         logger.info(f"Total mappings loaded: {len(combined_mappings)}")
+        
+        _mappings_cache[cache_key] = (signature, combined_mappings, loaded_categories)
         return combined_mappings
     
-    def load_mapping_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load a single mapping file"""
+    def _read_baked_mappings(self, mapping_files: List[Path], signature: tuple) -> Optional[Dict[str, Tuple[str, Dict[str, Any]]]]:
+        """Category and data of each mapping file from the baked blob, or None if it is missing or older than the JSON"""
+        if msgpack is None:
+            return None
+        
+        baked_path = self.mappings_dir / BAKED_MAPPINGS_NAME
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            category = data.get("category", file_path.stem)
-            self.loaded_mappings[category] = data
+            baked_mtime = baked_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        
+        # The JSON files stay the source of truth; a blob that predates an edit is ignored
+        if any(mtime > baked_mtime for _, _, mtime in signature):
+            logger.debug(f"Ignoring {baked_path}, a mapping file is newer")
+            return None
+        
+        try:
+            baked = msgpack.unpackb(zstandard.ZstdDecompressor().decompress(baked_path.read_bytes()))
+        except Exception as e:
+            logger.warning(f"Failed to read baked mappings {baked_path}: {str(e)}")
+            return None
+        
+        if set(baked) != {mapping_file.name for mapping_file in mapping_files}:
+            logger.debug(f"Ignoring {baked_path}, it was baked from a different set of mapping files")
+            return None
+        
+        logger.debug(f"Using baked mappings from {baked_path}")
+        return {name: (data.get("category", Path(name).stem), data) for name, data in baked.items()}
+    
+    def _parse_mapping_files(self, mapping_files: List[Path]) -> Dict[str, Optional[Tuple[str, Dict[str, Any]]]]:
+        """Parse the mapping files on a few threads, keyed by file name; merging stays with the caller"""
+        with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(mapping_files))) as executor:
+            results = executor.map(self._parse_mapping_file, mapping_files)
+            return {mapping_file.name: result for mapping_file, result in zip(mapping_files, results)}
+    
+    def _parse_mapping_file(self, file_path: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Category and data of a single mapping file, or None if it cannot be read"""
+        try:
+            data = fast_json.loads(Path(file_path).read_bytes())
             
-            return data
+            return data.get("category", file_path.stem), data
             
-        except json.JSONDecodeError as e:
+        except fast_json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in mapping file {file_path}: {str(e)}")
-            return {}
+            return None
         except Exception as e:
             logger.error(f"Error loading mapping file {file_path}: {str(e)}")
+            return None
+    
+    def load_mapping_file(self, file_path: Path) -> Dict[str, Any]:
+        """Load a single mapping file"""
+        parsed = self._parse_mapping_file(file_path)
+        if parsed is None:
             return {}
+        
+        category, data = parsed
+        self.loaded_mappings[category] = data
+        return data
     
     def get_mapping_by_category(self, category: str) -> Dict[str, str]:
         """Get mappings for a specific category"""
@@ -85,18 +194,22 @@ class MappingLoader:
     
     def find_mapping(self, java_texture: str) -> str:
         """Find a bedrock mapping for a java texture name"""
-        all_mappings = self.load_all_mappings()
+        all_mappings = self._all_mappings()
         return all_mappings.get(java_texture, java_texture)
     
     def has_mapping(self, java_texture: str) -> bool:
         """Check if a mapping exists for the given java texture"""
-        all_mappings = self.load_all_mappings()
+        all_mappings = self._all_mappings()
         return java_texture in all_mappings
     
     def get_unmapped_textures(self, java_textures: List[str]) -> List[str]:
         """Get list of textures that don't have mappings"""
-        all_mappings = self.load_all_mappings()
-        return [texture for texture in java_textures if texture not in all_mappings]
+        all_mappings = self._all_mappings()
+        # One hashed difference over the distinct names, then the caller's order (and repeats) is kept
+        unmapped = set(java_textures).difference(all_mappings)
+        if not unmapped:
+            return []
+        return [texture for texture in java_textures if texture in unmapped]
     
     def save_missing_mappings(self, missing_textures: List[str], output_file: str = "missing_mappings.json"):
         """Save missing mappings to a file for manual review"""
@@ -109,8 +222,7 @@ class MappingLoader:
         
         output_path = Path(output_file)
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(missing_data, f, indent=2)
+            output_path.write_bytes(fast_json.dumps(missing_data))
             
             logger.info(f"Saved {len(missing_textures)} missing mappings to {output_path}")
         except Exception as e:
@@ -124,23 +236,25 @@ class MappingLoader:
             "invalid_format": []
         }
         
-        all_mappings = self.load_all_mappings()
-        bedrock_mappings = {}
+        all_mappings = self._all_mappings()
+        java_by_bedrock = defaultdict(list)
         
         for java_texture, bedrock_texture in all_mappings.items():
-            if bedrock_texture in bedrock_mappings:
-                issues["duplicate_bedrock"].append(f"{java_texture} and {bedrock_mappings[bedrock_texture]} both map to {bedrock_texture}")
-            else:
-                bedrock_mappings[bedrock_texture] = java_texture
+            java_by_bedrock[bedrock_texture].append(java_texture)
             
             if not java_texture.endswith('.png') or not bedrock_texture.endswith('.png'):
                 issues["invalid_format"].append(f"{java_texture} -> {bedrock_texture}")
         
+        # One entry per collision listing every Java texture involved, not just the first pair
+        issues["duplicate_bedrock"] = [f"{', '.join(java_textures)} all map to {bedrock_texture}"
+                                       for bedrock_texture, java_textures in java_by_bedrock.items()
+                                       if len(java_textures) > 1]
+        
         return issues
     
     def create_reverse_mapping(self) -> Dict[str, str]:
         """Create a reverse mapping (bedrock -> java) for validation"""
-        all_mappings = self.load_all_mappings()
+        all_mappings = self._all_mappings()
         return {bedrock: java for java, bedrock in all_mappings.items()}
 
 if __name__ == "__main__":
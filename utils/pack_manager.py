@@ -4,20 +4,106 @@ Handles zip file operations and .mcpack creation
 """
 
 import os
+import re
+import copy
+import stat
 import json
 import zipfile
 import shutil
 import logging
+import tempfile
+from collections import deque
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Set, Tuple
+from utils.file_ops import fast_copy, iter_files, remove_tree
 
 logger = logging.getLogger(__name__)
 
+# The pack's minecraft folder: the first assets/minecraft/ along an entry's path
+_MINECRAFT_PREFIX = re.compile(r'(?:.*?/)?assets/minecraft/')
+# Entries below the minecraft folder the conversion reads from disk
+_EXTRACTED_ASSET = re.compile(r'(?:textures|lang)/|pack\.png$')
+# Assets copied unchanged into the Bedrock pack; copy_other_assets writes them straight from the zip
+_STREAMED_ASSETS = ("sounds", "models", "fonts", "gpu_warnlist.json", "regional_compliancies.json")
+_STREAMED_ASSET = re.compile(r'(?:sounds|models|fonts)/|(?:gpu_warnlist|regional_compliancies)\.json$')
+# pack.png/pack.mcmeta at any level, for the pack icon lookup
+_PACK_FILE = re.compile(r'(?:^|/)pack\.(?:png|mcmeta)$')
+# Folder of a PNG that sits directly in a category under a textures folder (block, item, entity, ...)
+_TEXTURE_CATEGORY = re.compile(r'(?:^|/)textures/([^/]*)/[^/]*$')
+# Path component right after the first textures folder
+_FIRST_TEXTURES_CHILD = re.compile(r'(?:.*?/)?textures/([^/]*)')
+
+# Asset copies wait on the filesystem rather than the CPU, so more threads than cores pay off
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# .mcpack source files are read on the I/O pool while earlier ones are written to the archive, in order;
+# small files are grouped into jobs of about this many bytes so each task outweighs its scheduling cost
+READ_BATCH_BYTES = 128 * 1024
+MAX_PENDING_BATCHES = COPY_WORKERS * 2
+# Files from this size up are streamed into the archive by ZipFile.write rather than held in memory
+STREAM_MIN_BYTES = 4 << 20
+
+# Packs are mostly PNGs and OGG sounds, which DEFLATE barely shrinks: they are stored as-is,
+# and the text files left over are small enough that the fastest level costs little in size
+MCPACK_COMPRESS_LEVEL = 1
+STORED_SUFFIXES = {'.png', '.ogg', '.jpg', '.jpeg'}
+
+def _read_batch(batch: List[Tuple[str, zipfile.ZipInfo]]) -> List[Optional[bytes]]:
+    """Contents of each file in the batch, or None for large files, which are streamed when written"""
+    contents = []
+    for file_path, zinfo in batch:
+        if zinfo.file_size >= STREAM_MIN_BYTES:
+            contents.append(None)
+            continue
+        with open(file_path, 'rb') as f:
+            contents.append(f.read())
+    return contents
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """stat() of a path, or None if it does not exist; one syscall answers both exists() and the file type"""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+@dataclass
+class ZipIndex:
+    """What validate_java_pack and get_pack_info read from a pack's file list, gathered in one pass"""
+    has_pack_mcmeta: bool = False
+    has_assets: bool = False
+    has_textures: bool = False
+    png_count: int = 0
+    # Folders holding PNGs directly under a textures folder (block, item, entity, ...)
+    texture_categories: Set[str] = field(default_factory=set)
+    # First path component after the first textures folder of each PNG
+    categories: Set[str] = field(default_factory=set)
+    mcmeta_name: Optional[str] = None
+
 class PackManager:
     """Manages resource pack file operations"""
     
-    def __init__(self):
+    def __init__(self, io_executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize the pack manager
+        
+        Args:
+            io_executor: Optional thread pool to copy asset files on instead of starting one
+        """
         self.temp_dirs: List[Path] = []
+        # minecraft folder from extract_java_pack -> (zip it came from, its prefix in the zip), for streamed assets
+        self._zip_sources: Dict[Path, Tuple[Path, str]] = {}
+        # Open input zips by (path, size, mtime) and their scanned name lists, so the central
+        # directory is parsed once per conversion; only kept between calls after keep_zips_open(),
+        # until close() or cleanup_temp_directories
+        self._keep_zips_open = False
+        self._zip_cache: Dict[Tuple[str, int, int], zipfile.ZipFile] = {}
+        self._zip_indexes: Dict[zipfile.ZipFile, ZipIndex] = {}
+        # Parsed pack.mcmeta fields per open zip, so repeated metadata lookups skip the read and parse
+        self._pack_metadata: Dict[zipfile.ZipFile, Dict[str, Any]] = {}
+        # Threads are only started once copies are submitted, so an unused pool costs nothing
+        self.io_executor = io_executor or ThreadPoolExecutor(max_workers=COPY_WORKERS)
     
     def extract_java_pack(self, input_path: str, extract_dir: Path) -> Optional[Path]:
         """
@@ -39,18 +125,49 @@ class PackManager:
             
             logger.info(f"Extracting Java resource pack: {input_path.name}")
             
-            with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            assets_dir = self._find_assets_directory(extract_dir)
-            if not assets_dir:
+            zip_ref = self._open_zip(input_path)
+            minecraft_prefix = self._find_minecraft_prefix(zip_ref.namelist())
+            if minecraft_prefix is None:
                 logger.error("Could not find assets/minecraft directory in the Java resource pack")
                 return None
             
-            minecraft_dir = assets_dir / 'minecraft'
-            if not minecraft_dir.exists():
-                logger.error("Could not find minecraft directory in assets")
-                return None
+            # A top-level minecraft folder is placed under assets_mock/, standing in for an assets folder
+            minecraft_root = extract_dir / 'assets_mock' if minecraft_prefix == 'minecraft/' else extract_dir
+            minecraft_dir = Path(zip_ref.extract(zipfile.ZipInfo(minecraft_prefix), minecraft_root))
+            
+            # Only the entries the conversion reads are extracted, straight from the zip's name list
+            minecraft_members = []
+            pack_members = []
+            skipped = 0
+            streamed = 0
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+                
+                name = info.filename
+                if name.startswith(minecraft_prefix):
+                    relative_name = name[len(minecraft_prefix):]
+                    if _EXTRACTED_ASSET.match(relative_name):
+                        minecraft_members.append(info)
+                        continue
+                    if _STREAMED_ASSET.match(relative_name):
+                        streamed += 1
+                        continue
+                
+                if _PACK_FILE.search(name):
+                    pack_members.append(info)
+                else:
+                    skipped += 1
+            
+            self._extract_members(zip_ref, minecraft_members, minecraft_root)
+            self._extract_members(zip_ref, pack_members, extract_dir)
+            
+            if skipped:
+                logger.debug(f"Skipped {skipped} entries the conversion does not use")
+            if streamed:
+                logger.debug(f"Left {streamed} pass-through entries in the zip for copy_other_assets")
+            
+            self._zip_sources[minecraft_dir] = (input_path, minecraft_prefix)
             
             logger.info(f"Found minecraft directory: {minecraft_dir}")
             return minecraft_dir
@@ -61,31 +178,55 @@ class PackManager:
         except Exception as e:
             logger.error(f"Failed to extract Java resource pack: {str(e)}")
             return None
+        finally:
+            self._release_zips()
     
-    def _find_assets_directory(self, extract_dir: Path) -> Optional[Path]:
-        """Find the assets directory in the extracted files"""
-        for root, dirs, files in os.walk(extract_dir):
-            if 'assets' in dirs:
-                assets_path = Path(root) / 'assets'
-                if (assets_path / 'minecraft').exists():
-                    return assets_path
+    def _extract_members(self, zip_ref: zipfile.ZipFile, members: List[zipfile.ZipInfo], extract_dir: Path) -> int:
+        """
+        Extract file entries in parallel and return how many files were written
+        Their folders are created first, on this thread, so no two extracts race to make one
+        """
+        if members:
+            os.makedirs(extract_dir, exist_ok=True)
         
-        if (extract_dir / 'minecraft').exists():
-            assets_mock = extract_dir / 'assets_mock'
-            assets_mock.mkdir(exist_ok=True)
-            
-            minecraft_src = extract_dir / 'minecraft'
-            minecraft_dst = assets_mock / 'minecraft'
-            
-            if not minecraft_dst.exists():
-                shutil.move(str(minecraft_src), str(minecraft_dst))
-            
-            return assets_mock
+        created_dirs = set()
+        # A repeated name keeps its last entry, as extracting in order would
+        unique_members = {}
+        for info in members:
+            parent = info.filename.rpartition('/')[0]
+            if parent and parent not in created_dirs:
+                created_dirs.add(parent)
+                # A directory ZipInfo goes through zipfile's own path sanitising, like the file will
+                zip_ref.extract(zipfile.ZipInfo(parent + '/'), extract_dir)
+            unique_members[info.filename] = info
         
-        return None
+        # Inflating releases the GIL, so entries decompress in parallel from the shared ZipFile
+        extracts = [self.io_executor.submit(zip_ref.extract, info, extract_dir) for info in unique_members.values()]
+        wait(extracts)
+        for future in extracts:
+            future.result()
+        
+        return len(extracts)
     
-    def create_mcpack(self, bedrock_temp: Path, output_path: str) -> bool:
-        """Create the final .mcpack file"""
+    def _find_minecraft_prefix(self, names: List[str]) -> Optional[str]:
+        """
+        Zip prefix of the pack's assets/minecraft folder, the shallowest one if there are several,
+        or 'minecraft/' for packs that keep the folder at the top level
+        """
+        prefix = None
+        for name in names:
+            match = _MINECRAFT_PREFIX.match(name)
+            if match and (prefix is None or match.group().count('/') < prefix.count('/')):
+                prefix = match.group()
+        
+        if prefix is None and any(name.startswith('minecraft/') for name in names):
+            return 'minecraft/'
+        
+        return prefix
+    
+    def create_mcpack(self, bedrock_temp: Path, output_path: str,
+                      compress_level: int = MCPACK_COMPRESS_LEVEL) -> bool:
+        """Create the final .mcpack file, deflating entries at compress_level"""
         try:
             output_path = Path(output_path)
             
@@ -96,16 +237,35 @@ class PackManager:
             
             logger.info(f"Creating .mcpack file: {output_path}")
             
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
-                file_count = 0
-                for file_path in bedrock_temp.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(bedrock_temp)
-                        zipf.write(file_path, arcname)
-                        file_count += 1
-                        
-                        if file_count % 100 == 0:
-                            logger.debug(f"Added {file_count} files to .mcpack")
+            file_count = 0
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compress_level) as zipf:
+                # Batches in submission order; the oldest is written once the window is full
+                pending = deque()
+                batch = []
+                batch_bytes = 0
+                
+                # Entry paths all start with the root and a separator, so slicing it off gives the arcname
+                root_len = len(os.path.join(str(bedrock_temp), ''))
+                for entry in iter_files(bedrock_temp):
+                    zinfo = zipfile.ZipInfo.from_file(entry.path, entry.path[root_len:])
+                    if os.path.splitext(entry.name)[1].lower() in STORED_SUFFIXES:
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                    else:
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    batch.append((entry.path, zinfo))
+                    batch_bytes += zinfo.file_size
+                    
+                    if batch_bytes >= READ_BATCH_BYTES:
+                        pending.append((batch, self.io_executor.submit(_read_batch, batch)))
+                        batch = []
+                        batch_bytes = 0
+                        if len(pending) >= MAX_PENDING_BATCHES:
+                            file_count = self._write_batch(zipf, *pending.popleft(), file_count, compress_level)
+                
+                if batch:
+                    pending.append((batch, self.io_executor.submit(_read_batch, batch)))
+                while pending:
+                    file_count = self._write_batch(zipf, *pending.popleft(), file_count, compress_level)
             
             file_size = output_path.stat().st_size
             size_mb = file_size / (1024 * 1024)
@@ -119,6 +279,22 @@ class PackManager:
             logger.error(f"Failed to create .mcpack file: {str(e)}")
             return False
     
+    def _write_batch(self, zipf: zipfile.ZipFile, batch: List[Tuple[str, zipfile.ZipInfo]],
+                     future: Future, file_count: int, compress_level: int) -> int:
+        """Write one read batch to the archive and return the updated file count"""
+        for (file_path, zinfo), data in zip(batch, future.result()):
+            if data is None:
+                # ZipFile.write copies and compresses the file a chunk at a time
+                zipf.write(file_path, zinfo.filename, zinfo.compress_type, compress_level)
+            else:
+                zipf.writestr(zinfo, data, compresslevel=compress_level)
+            file_count += 1
+            
+            if file_count % 100 == 0:
+                logger.debug(f"Added {file_count} files to .mcpack")
+        
+        return file_count
+    
     def validate_java_pack(self, input_path: str) -> Dict[str, Any]:
         """Validate Java Edition resource pack structure"""
         validation_result = {
@@ -141,26 +317,13 @@ class PackManager:
                 validation_result["errors"].append("File is not a .zip file")
                 return validation_result
             
-            with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                if any('pack.mcmeta' in f for f in file_list):
-                    validation_result["has_pack_mcmeta"] = True
-                
-                if any('assets/' in f for f in file_list):
-                    validation_result["has_assets"] = True
-                
-                texture_paths = [f for f in file_list if 'textures/' in f and f.endswith('.png')]
-                if texture_paths:
-                    validation_result["has_textures"] = True
-                
-                categories = set()
-                for texture_path in texture_paths:
-                    parts = texture_path.split('/')
-                    if len(parts) >= 3 and parts[-3] == 'textures':
-                        categories.add(parts[-2])  # block, item, entity, etc.
-                
-                validation_result["texture_categories"] = sorted(list(categories))
+            # Opened through the cache, so extraction reuses this handle and its scanned index
+            index = self._scan_zip_index(self._open_zip(input_path))
+            
+            validation_result["has_pack_mcmeta"] = index.has_pack_mcmeta
+            validation_result["has_assets"] = index.has_assets
+            validation_result["has_textures"] = index.has_textures
+            validation_result["texture_categories"] = sorted(index.texture_categories)
             
             validation_result["valid"] = (
                 validation_result["has_assets"] and 
@@ -177,15 +340,72 @@ class PackManager:
             validation_result["errors"].append("Invalid or corrupted zip file")
         except Exception as e:
             validation_result["errors"].append(f"Validation error: {str(e)}")
+        finally:
+            self._release_zips()
         
         return validation_result
     
     def get_pack_info(self, input_path: str) -> Dict[str, Any]:
         """Get information about a Java Edition resource pack"""
-        pack_info = {
+        # Both halves read the same open zip
+        keep_zips_open = self._keep_zips_open
+        self._keep_zips_open = True
+        try:
+            pack_info = self.get_pack_metadata(input_path)
+            pack_info.update(self.get_pack_stats(input_path))
+        finally:
+            self._keep_zips_open = keep_zips_open
+            self._release_zips()
+        return pack_info
+    
+    def get_pack_metadata(self, input_path: str) -> Dict[str, Any]:
+        """Get the name, description and format of a Java Edition resource pack from its pack.mcmeta"""
+        pack_metadata = {
             "name": "Unknown Pack",
             "description": "No description",
-            "pack_format": None,
+            "pack_format": None
+        }
+        
+        try:
+            input_path = Path(input_path)
+            
+            zip_ref = self._open_zip(input_path)
+            cached = self._pack_metadata.get(zip_ref)
+            if cached is not None:
+                return dict(cached)
+            
+            mcmeta_name = self._find_mcmeta_name(zip_ref)
+            if mcmeta_name is not None:
+                try:
+                    mcmeta_content = zip_ref.read(mcmeta_name)
+                    mcmeta_data = json.loads(mcmeta_content.decode('utf-8'))
+                    
+                    pack_data = mcmeta_data.get('pack', {})
+                    pack_metadata["description"] = pack_data.get('description', pack_metadata["description"])
+                    pack_metadata["pack_format"] = pack_data.get('pack_format')
+                    
+                    if pack_metadata["description"] != "No description":
+                        pack_metadata["name"] = pack_metadata["description"][:50]  # First 50 chars
+                    else:
+                        pack_metadata["name"] = input_path.stem
+                        
+                except json.JSONDecodeError:
+                    logger.warning("Could not parse pack.mcmeta")
+            else:
+                pack_metadata["name"] = input_path.stem
+            
+            self._pack_metadata[zip_ref] = dict(pack_metadata)
+                
+        except Exception as e:
+            logger.error(f"Failed to get pack metadata: {str(e)}")
+        finally:
+            self._release_zips()
+        
+        return pack_metadata
+    
+    def get_pack_stats(self, input_path: str) -> Dict[str, Any]:
+        """Get the file size, texture count and texture categories of a Java Edition resource pack"""
+        pack_stats = {
             "file_size": 0,
             "texture_count": 0,
             "categories": []
@@ -193,55 +413,110 @@ class PackManager:
         
         try:
             input_path = Path(input_path)
-            pack_info["file_size"] = input_path.stat().st_size
+            pack_stats["file_size"] = input_path.stat().st_size
             
-            with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                texture_files = [f for f in file_list if f.endswith('.png')]
-                pack_info["texture_count"] = len(texture_files)
-                
-                categories = set()
-                for texture_path in texture_files:
-                    if 'textures/' in texture_path:
-                        parts = texture_path.split('/')
-                        texture_idx = next(i for i, part in enumerate(parts) if part == 'textures')
-                        if texture_idx + 1 < len(parts):
-                            categories.add(parts[texture_idx + 1])
+            index = self._scan_zip_index(self._open_zip(input_path))
+            pack_stats["texture_count"] = index.png_count
+            pack_stats["categories"] = sorted(index.categories)
                 
-                pack_info["categories"] = sorted(list(categories))
-                
-                mcmeta_files = [f for f in file_list if f.endswith('pack.mcmeta')]
-                if mcmeta_files:
-                    try:
-                        mcmeta_content = zip_ref.read(mcmeta_files[0])
-                        mcmeta_data = json.loads(mcmeta_content.decode('utf-8'))
-                        
-                        pack_data = mcmeta_data.get('pack', {})
-                        pack_info["description"] = pack_data.get('description', pack_info["description"])
-                        pack_info["pack_format"] = pack_data.get('pack_format')
-                        
-                        if pack_info["description"] != "No description":
-                            pack_info["name"] = pack_info["description"][:50]  # First 50 chars
-                        else:
-                            pack_info["name"] = input_path.stem
-                            
-                    except json.JSONDecodeError:
-                        logger.warning("Could not parse pack.mcmeta")
-                else:
-                    pack_info["name"] = input_path.stem
-                    
         except Exception as e:
-            logger.error(f"Failed to get pack info: {str(e)}")
+            logger.error(f"Failed to get pack stats: {str(e)}")
+        finally:
+            self._release_zips()
         
-        return pack_info
+        return pack_stats
+    
+    def _find_mcmeta_name(self, zip_ref: zipfile.ZipFile) -> Optional[str]:
+        """Name of the pack.mcmeta entry get_pack_metadata reads, found without scanning the whole pack when possible"""
+        index = self._zip_indexes.get(zip_ref)
+        if index is not None:
+            return index.mcmeta_name
+        # Same pick as _scan_zip_index (the first matching name), but the scan stops there
+        return next((name for name in zip_ref.namelist() if name.endswith('pack.mcmeta')), None)
+    
+    def _scan_zip_index(self, zip_ref: zipfile.ZipFile) -> ZipIndex:
+        """Collect the pack structure flags, texture categories and pack.mcmeta entry in one pass over the names"""
+        index = self._zip_indexes.get(zip_ref)
+        if index is not None:
+            return index
+        
+        index = ZipIndex()
+        self._zip_indexes[zip_ref] = index
+        
+        for name in zip_ref.namelist():
+            if 'assets/' in name:
+                index.has_assets = True
+            
+            if 'pack.mcmeta' in name:
+                index.has_pack_mcmeta = True
+                if index.mcmeta_name is None and name.endswith('pack.mcmeta'):
+                    index.mcmeta_name = name
+            
+            if not name.endswith('.png'):
+                continue
+            index.png_count += 1
+            
+            if 'textures/' not in name:
+                continue
+            index.has_textures = True
+            
+            category_match = _TEXTURE_CATEGORY.search(name)
+            if category_match:
+                index.texture_categories.add(category_match.group(1))
+            first_match = _FIRST_TEXTURES_CHILD.match(name)
+            if first_match:
+                index.categories.add(first_match.group(1))
+        
+        return index
+    
+    def _open_zip(self, input_path: Path) -> zipfile.ZipFile:
+        """Open a pack zip for reading, reusing the open handle while the file is unchanged"""
+        file_stat = input_path.stat()
+        cache_key = (str(input_path.resolve()), file_stat.st_size, file_stat.st_mtime_ns)
+        zip_ref = self._zip_cache.get(cache_key)
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(input_path, 'r')
+            self._zip_cache[cache_key] = zip_ref
+        return zip_ref
+    
+    def set_executor(self, executor: ThreadPoolExecutor):
+        """Copy and delete asset files on another thread pool, such as one shared with the converters"""
+        self.io_executor = executor
+    
+    def keep_zips_open(self):
+        """Keep opened input zips (and their scanned indexes) for the following calls, until close()"""
+        self._keep_zips_open = True
+    
+    def close(self):
+        """Close the cached input zips, so the pack files are no longer held open"""
+        for zip_ref in self._zip_cache.values():
+            zip_ref.close()
+        self._zip_cache.clear()
+        self._zip_indexes.clear()
+        self._pack_metadata.clear()
+        self._keep_zips_open = False
+    
+    def __enter__(self):
+        self.keep_zips_open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _release_zips(self):
+        """End of a public call: close the input zips unless keep_zips_open() asked to keep them"""
+        if not self._keep_zips_open:
+            self.close()
     
     def cleanup_temp_directories(self):
-        """Clean up temporary directories"""
+        """Clean up temporary directories and close the cached input zips"""
+        self.close()
+        self._zip_sources.clear()
+        
         for temp_dir in self.temp_dirs:
             if temp_dir.exists():
                 try:
-                    shutil.rmtree(temp_dir)
+                    remove_tree(temp_dir, self.io_executor)
                     logger.debug(f"Cleaned up temporary directory: {temp_dir}")
                 except Exception as e:
                     logger.warning(f"Failed to clean up {temp_dir}: {str(e)}")
@@ -250,8 +525,6 @@ class PackManager:
     
     def create_temp_directory(self, base_name: str = "je2be_temp") -> Path:
         """Create a temporary directory and track it for cleanup"""
-        import tempfile
-        
         temp_dir = Path(tempfile.mkdtemp(prefix=f"{base_name}_"))
         self.temp_dirs.append(temp_dir)
         logger.debug(f"Created temporary directory: {temp_dir}")
@@ -276,49 +549,83 @@ class PackManager:
             ]
             
             for pack_png in pack_png_locations:
-                if pack_png.exists():
+                pack_png_stat = _stat_or_none(pack_png)
+                if pack_png_stat is not None and stat.S_ISREG(pack_png_stat.st_mode):
                     pack_icon_dest = bedrock_temp / "pack_icon.png"
                     shutil.copy2(pack_png, pack_icon_dest)
                     stats["pack_icon"] = 1
                     logger.info(f"Copied pack.png as pack_icon.png from {pack_png}")
                     break
             
-            java_sounds = minecraft_dir / "sounds"
-            bedrock_sounds = bedrock_temp / "sounds"
-            
-            if java_sounds.exists():
-                stats["sounds"] = self._copy_directory_contents(java_sounds, bedrock_sounds)
-                logger.info(f"Copied {stats['sounds']} sound files")
-            
-            java_models = minecraft_dir / "models"
-            bedrock_models = bedrock_temp / "models"
-            
-            if java_models.exists():
-                stats["models"] = self._copy_directory_contents(java_models, bedrock_models)
-                logger.info(f"Copied {stats['models']} model files")
+            zip_source = self._zip_sources.get(minecraft_dir)
+            zip_ref = self._open_zip(zip_source[0]) if zip_source else None
+            for asset in _STREAMED_ASSETS:
+                if zip_ref is not None:
+                    copied = self._copy_zip_asset(zip_ref, zip_source[1], asset, bedrock_temp)
+                else:
+                    copied = self._copy_asset(minecraft_dir / asset, bedrock_temp / asset)
+                if copied is None:
+                    continue
+                
+                if asset == "sounds":
+                    stats["sounds"] = copied
+                    logger.info(f"Copied {copied} sound files")
+                elif asset == "models":
+                    stats["models"] = copied
+                    logger.info(f"Copied {copied} model files")
+                else:
+                    stats["other"] += copied
             
             java_lang = minecraft_dir / "lang"
-            if java_lang.exists():
+            java_lang_stat = _stat_or_none(java_lang)
+            if java_lang_stat is not None and stat.S_ISDIR(java_lang_stat.st_mode):
                 stats["lang_files"] = len(list(java_lang.glob("*.json")))
                 logger.info(f"Found {stats['lang_files']} language files")
             
-            other_dirs = ["fonts", "gpu_warnlist.json", "regional_compliancies.json"]
-            for other_item in other_dirs:
-                java_path = minecraft_dir / other_item
-                if java_path.exists():
-                    bedrock_path = bedrock_temp / other_item
-                    if java_path.is_file():
-                        bedrock_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(java_path, bedrock_path)
-                        stats["other"] += 1
-                    elif java_path.is_dir():
-                        stats["other"] += self._copy_directory_contents(java_path, bedrock_path)
-            
         except Exception as e:
             logger.warning(f"Failed to copy some assets: {str(e)}")
+        finally:
+            self._release_zips()
         
         return stats
     
+    def _copy_asset(self, java_path: Path, bedrock_path: Path) -> Optional[int]:
+        """Copy an extracted file or folder and return the file count, or None if it does not exist"""
+        java_stat = _stat_or_none(java_path)
+        if java_stat is None:
+            return None
+        if stat.S_ISREG(java_stat.st_mode):
+            bedrock_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(java_path, bedrock_path)
+            return 1
+        if stat.S_ISDIR(java_stat.st_mode):
+            return self._copy_directory_contents(java_path, bedrock_path)
+        return None
+    
+    def _copy_zip_asset(self, zip_ref: zipfile.ZipFile, zip_prefix: str, asset: str, bedrock_temp: Path) -> Optional[int]:
+        """Write a file or folder of the zip's minecraft folder straight to bedrock_temp; file count, or None if absent"""
+        name = zip_prefix + asset
+        folder_prefix = name + '/'
+        found = False
+        members = []
+        for info in zip_ref.infolist():
+            if info.filename == name or info.filename.startswith(folder_prefix):
+                found = True
+                if not info.is_dir():
+                    # The renamed copy lands relative to bedrock_temp but still reads the original entry
+                    member = copy.copy(info)
+                    member.filename = info.filename[len(zip_prefix):]
+                    members.append(member)
+        
+        if not found:
+            return None
+        
+        try:
+            return self._extract_members(zip_ref, members, bedrock_temp)
+        except Exception as e:
+            logger.warning(f"Error copying {name} to {bedrock_temp / asset}: {str(e)}")
+            return 0
+    
     def _copy_directory_contents(self, src_dir: Path, dst_dir: Path) -> int:
         """Copy contents of a directory and return file count"""
         file_count = 0
@@ -326,13 +633,27 @@ class PackManager:
         try:
             dst_dir.mkdir(parents=True, exist_ok=True)
             
-            for item in src_dir.rglob("*"):
-                if item.is_file():
-                    relative_path = item.relative_to(src_dir)
-                    dst_path = dst_dir / relative_path
-                    dst_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dst_path)
+            pairs = []
+            dst_parents = set()
+            src_len = len(os.path.join(str(src_dir), ''))
+            dst_root = str(dst_dir)
+            for entry in iter_files(src_dir):
+                dst_path = os.path.join(dst_root, entry.path[src_len:])
+                pairs.append((entry.path, dst_path))
+                dst_parents.add(os.path.dirname(dst_path))
+            
+            # One makedirs per destination folder rather than per file, before any copy starts
+            for dst_parent in dst_parents:
+                os.makedirs(dst_parent, exist_ok=True)
+            
+            # The copies themselves overlap on the I/O pool
+            copies = [(src_path, self.io_executor.submit(fast_copy, src_path, dst_path)) for src_path, dst_path in pairs]
+            for src_path, future in copies:
+                try:
+                    future.result()
                     file_count += 1
+                except Exception as e:
+                    logger.warning(f"Error copying {src_path}: {str(e)}")
                     
         except Exception as e:
             logger.warning(f"Error copying {src_dir} to {dst_dir}: {str(e)}")